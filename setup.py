@@ -20,6 +20,7 @@ install_requires = [
     "fastapi>=0.100.0",
     "uvicorn>=0.23.0",
     "aiofiles>=23.0.0",
+    "jinja2>=3.1",
 ]
 
 # Optional dependencies for full functionality
@@ -21,7 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Import MAMS systems
 from mams_logging import MAMSLogger
-from mams_deduplication_engine import MAMSDeduplicationEngine
+from mams_deduplication_engine import MAMSDeduplicationEngine, get_pool, close_pool
 
 class BackendServiceDiscovery:
     """
@@ -282,23 +282,22 @@ class BackendServiceDiscovery:
                 'previous_execution_id': dedup_analysis.get('previous_execution_id')
             }
         
-        import asyncpg
-        conn = await asyncpg.connect("postgresql://admin:chooters@db:5432/arkyvus_db")
-        
-        try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
             storage_results = await self.dedup_engine.execute_deduplication_actions(
                 conn, dedup_analysis, self.logger.execution_id
             )
             
             return storage_results
-            
-        finally:
-            await conn.close()
 
 async def main():
     """Execute MAMS-002 Backend Discovery"""
     discovery = BackendServiceDiscovery()
-    results = await discovery.execute_discovery()
+    try:
+        results = await discovery.execute_discovery()
+    finally:
+        # The shared pool is bound to this event loop - release its connections with it
+        await close_pool()
     
     print("\n🎯 MAMS-002 Backend Discovery Results:")
     print(f"📊 Execution ID: {results['execution_id']}")
@@ -38,7 +38,7 @@ def load_master_mapping() -> Dict[str, Any]:
             return json.load(f)
     return {'mappings': {}, 'metadata': {}}
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Evidence for domain classification"""
     type: str  # 'import', 'export', 'keyword', 'api_call', 'jsx_element', 'hook', 'file_path'
@@ -47,7 +47,7 @@ class Evidence:
     source_line: Optional[int] = None
     confidence: float = 1.0
 
-@dataclass
+@dataclass(slots=True)
 class DomainScore:
     """Score for a specific domain"""
     domain: str
@@ -57,7 +57,7 @@ class DomainScore:
     evidence: List[Evidence]
     confidence: float
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedClassificationResult:
     """Enhanced classification with confidence and evidence"""
     file_path: str
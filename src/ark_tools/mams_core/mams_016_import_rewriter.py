@@ -13,6 +13,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 # Add parent paths for imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -158,37 +164,89 @@ class ImportRewriter:
             '/Users/pregenie/Development/arkyvus_project/client/src'
         ]
         
+        # Compile the import patterns of every move once, not per scanned file
+        patterns = self._collect_import_patterns(file_moves)
+        scanner = self._compile_import_scanner(patterns)
+        
         for search_dir in search_dirs:
             search_path = Path(search_dir)
             if search_path.exists():
                 for file_path in search_path.rglob('*.ts*'):
                     if file_path.suffix in ['.ts', '.tsx', '.js', '.jsx']:
                         # Check if this file imports any moved files
-                        if await self._file_imports_moved_files(file_path, file_moves):
+                        if await self._file_imports_moved_files(file_path, file_moves,
+                                                                patterns, scanner):
                             affected.add(str(file_path))
                 break
         
         return affected
     
     async def _file_imports_moved_files(self, file_path: Path, 
-                                       file_moves: List[FileMove]) -> bool:
+                                       file_moves: List[FileMove],
+                                       patterns: Optional[List[str]] = None,
+                                       scanner: Optional[Any] = None) -> bool:
         """Check if a file imports any of the moved files"""
         try:
+            if scanner is not None:
+                # Single pass over the raw bytes with the compiled Hyperscan database
+                # The handler stops the scan on the first hit, which Hyperscan
+                # reports by raising ScanTerminated
+                matched = []
+                try:
+                    scanner.scan(file_path.read_bytes(),
+                                 match_event_handler=self._on_import_match,
+                                 context=matched)
+                except hyperscan.ScanTerminated:
+                    return True
+                return bool(matched)
+            
             content = file_path.read_text()
             
-            for move in file_moves:
-                # Check various import patterns
-                moved_file_patterns = self._get_import_patterns_for_file(move.from_path)
-                
-                for pattern in moved_file_patterns:
-                    if pattern in content:
-                        return True
+            if patterns is None:
+                patterns = self._collect_import_patterns(file_moves)
+            
+            for pattern in patterns:
+                if pattern in content:
+                    return True
                         
         except Exception as e:
             debug_log.error_trace(f"Error checking imports in {file_path}", exception=e)
         
         return False
     
+    def _collect_import_patterns(self, file_moves: List[FileMove]) -> List[str]:
+        """Get the de-duplicated import patterns for all moved files"""
+        patterns: Dict[str, None] = {}
+        for move in file_moves:
+            for pattern in self._get_import_patterns_for_file(move.from_path):
+                patterns[pattern] = None
+        return list(patterns)
+    
+    def _compile_import_scanner(self, patterns: List[str]) -> Optional[Any]:
+        """Compile fixed-string import patterns into a Hyperscan database"""
+        if not HYPERSCAN_AVAILABLE or not patterns:
+            return None
+        
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[re.escape(pattern).encode() for pattern in patterns],
+                ids=list(range(len(patterns))),
+                elements=len(patterns),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+            )
+            return db
+        except Exception as e:
+            debug_log.error_trace("Failed to compile Hyperscan import patterns", exception=e)
+            return None
+    
+    @staticmethod
+    def _on_import_match(pattern_id: int, start: int, end: int,
+                         flags: int, context: List[int]) -> bool:
+        """Hyperscan match handler - record the hit and stop scanning"""
+        context.append(pattern_id)
+        return True
+    
     def _get_import_patterns_for_file(self, file_path: str) -> List[str]:
         """Get possible import patterns for a file"""
         patterns = []
@@ -5,26 +5,110 @@ Integrates all frontend alignment components with existing MAMS orchestrator
 """
 
 import os
+import re
 import json
 import asyncio
+import errno
+import hashlib
+import logging
 import shutil
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from operator import itemgetter
 
-# Add parent paths for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from arkyvus.utils.debug_logger import debug_log
 from arkyvus.migrations.mams_013_typescript_ast_parser import TypeScriptASTParser
-from arkyvus.migrations.mams_014_enhanced_frontend_analyzer import EnhancedFrontendAnalyzer
+from arkyvus.migrations.mams_014_enhanced_frontend_analyzer import (
+    EnhancedFrontendAnalyzer, EnhancedClassificationResult, DomainScore, Evidence,
+    DomainOntology, load_master_mapping
+)
 from arkyvus.migrations.mams_015_dependency_validator import (
     FrontendDependencyValidator, MigrationMove
 )
 from arkyvus.migrations.mams_016_import_rewriter import ImportRewriter, FileMove
 
+# Suppress AMQP/RabbitMQ errors that aren't relevant (child loggers inherit the level)
+logging.getLogger('pika').setLevel(logging.WARNING)
+
+def _dump_json(data: Any, indent: bool = False, default: Optional[Any] = None) -> bytes:
+    """Serialize to JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, default=default).encode()
+
+
+def _load_json(blob: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def _replace_or_move(source: str, target: str):
+    """Rename with a single os.replace, falling back to shutil.move across filesystems"""
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, target)
+
+
+# Directories never descended into when collecting frontend files
+PRUNED_FRONTEND_DIRS = frozenset({'node_modules', '.git', 'dist', 'build', '.next'})
+
+# Filename rules for the target subdirectory, checked in order (first match wins)
+TARGET_SUBDIR_RULES = (
+    (re.compile(r'(?i:component)|\.tsx$'), 'components'),
+    (re.compile(r'service|api', re.IGNORECASE), 'services'),
+    (re.compile(r'(?i:hook)|^use'), 'hooks'),
+    (re.compile(r'context', re.IGNORECASE), 'contexts'),
+    (re.compile(r'util|helper', re.IGNORECASE), 'utils'),
+    (re.compile(r'(?i:type)|\.d\.ts'), 'types'),
+)
+
+# Files sharing a moved file's stem that travel with it: <stem>.<prefix>* or <stem>.<suffix>
+ASSOCIATED_FILE_PREFIXES = ('test.', 'spec.', 'module.', 'styles.')
+ASSOCIATED_FILE_SUFFIXES = frozenset({'css', 'scss'})
+
+# Above this many classifications the confidence stats are bucketed with NumPy
+NUMPY_STATS_THRESHOLD = 10_000
+
+# OS errors worth retrying when many moves run at once (fd exhaustion, busy files)
+TRANSIENT_MOVE_ERRNOS = frozenset({errno.EMFILE, errno.ENFILE, errno.EAGAIN, errno.EBUSY})
+
+# Bump when the analyzer's classification logic changes so cached results are discarded
+ANALYSIS_CACHE_VERSION = 1
+
+# Per-process analyzer used by pool workers (built lazily on first task)
+_worker_analyzer: Optional[EnhancedFrontendAnalyzer] = None
+
+
+def _analyze_file_worker(file_path: Path) -> Any:
+    """Process pool entry point - analyze one file with the worker's analyzer"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = EnhancedFrontendAnalyzer()
+    return asyncio.run(_worker_analyzer.analyze_file(file_path))
+
+
 @dataclass
 class FrontendMigrationPlan:
     """Complete frontend migration plan"""
@@ -55,23 +139,53 @@ class FrontendMigrationOrchestrator:
     Integrates with existing MAMS system
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 32, process_workers: Optional[int] = None):
+        self.max_concurrency = max_concurrency
+        # CPU-bound classification runs in worker processes; 0 disables the pool
+        self._pool = (ProcessPoolExecutor(max_workers=process_workers or os.cpu_count())
+                      if process_workers != 0 else None)
         self.ts_parser = TypeScriptASTParser()
-        self.analyzer = EnhancedFrontendAnalyzer()
+        # Workers build their own analyzer - only in-process analysis needs one here
+        self.analyzer = EnhancedFrontendAnalyzer() if self._pool is None else None
         self.validator = FrontendDependencyValidator()
         self.rewriter = ImportRewriter()
         self.state = self._load_state()
+        self._last_state_blob: Optional[bytes] = None
+        # Debounce state saves during Phase 1 - persist every N moves
+        self._dirty = 0
+        self._save_every = 64
+        self.analysis_cache_file = Path('.migration/analysis_cache.json')
+        self._cache_mapping_hash = self._classification_inputs_hash()
+        self._analysis_cache = self._load_analysis_cache()
         self.migration_dir = Path('/app/.migration')
         self.migration_dir.mkdir(exist_ok=True)
         
+    def close(self):
+        """Shut down the analysis process pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
     def _load_state(self) -> MigrationState:
         """Load migration state for idempotency"""
         state_file = Path('.migration/frontend_migration_state.json')
         
         if state_file.exists():
             try:
-                data = json.loads(state_file.read_text())
-                return MigrationState(**data)
+                data = _load_json(state_file.read_bytes())
+                return MigrationState(
+                    data.get('completed_moves', []),
+                    data.get('failed_moves', []),
+                    data.get('import_updates_applied', []),
+                    data.get('rollback_data', {}),
+                    data.get('last_checkpoint', datetime.now().isoformat())
+                )
             except Exception as e:
                 debug_log.error_trace("Failed to load migration state", exception=e)
         
@@ -83,31 +197,101 @@ class FrontendMigrationOrchestrator:
             last_checkpoint=datetime.now().isoformat()
         )
     
-    def _save_state(self):
-        """Save migration state"""
-        state_file = Path('.migration/frontend_migration_state.json')
-        state_file.parent.mkdir(exist_ok=True)
-        
-        state_data = {
+    def _state_data(self) -> Dict[str, Any]:
+        """Snapshot the migration state as a serializable dict"""
+        return {
             'completed_moves': self.state.completed_moves,
             'failed_moves': self.state.failed_moves,
             'import_updates_applied': self.state.import_updates_applied,
             'rollback_data': self.state.rollback_data,
             'last_checkpoint': self.state.last_checkpoint
         }
+    
+    def _save_state(self, blob: Optional[bytes] = None):
+        """Save migration state, optionally from an already serialized blob"""
+        state_file = Path('.migration/frontend_migration_state.json')
+        state_file.parent.mkdir(exist_ok=True)
+        
+        if blob is None:
+            blob = _dump_json(self._state_data(), indent=True)
+        
+        # Skip the write when nothing changed since the last save
+        if blob == self._last_state_blob:
+            return
+        
+        state_file.write_bytes(blob)
+        self._last_state_blob = blob
+    
+    @staticmethod
+    def _classification_inputs_hash() -> str:
+        """Hash the ontology and master mapping that classifications are derived from"""
+        ontology = DomainOntology()
+        return hashlib.sha256(_dump_json({
+            'domains': ontology.domains,
+            'evidence_weights': ontology.evidence_weights,
+            'master_mapping': load_master_mapping()
+        }, default=sorted)).hexdigest()
+    
+    def _load_analysis_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached classifications keyed by path|mtime_ns|size"""
+        if self.analysis_cache_file.exists():
+            try:
+                data = _load_json(self.analysis_cache_file.read_bytes())
+                # Results from another analyzer version or ontology/mapping are stale
+                if (data.get('version') == ANALYSIS_CACHE_VERSION
+                        and data.get('mapping_hash') == self._cache_mapping_hash):
+                    return data['entries']
+                debug_log.api("Analysis cache is out of date, discarding it", level="INFO")
+            except Exception as e:
+                debug_log.error_trace("Failed to load analysis cache", exception=e)
         
-        state_file.write_text(json.dumps(state_data, indent=2))
+        return {}
+    
+    def _save_analysis_cache(self):
+        """Persist the analysis cache atomically"""
+        self.analysis_cache_file.parent.mkdir(exist_ok=True)
+        tmp_file = self.analysis_cache_file.with_suffix('.tmp')
+        tmp_file.write_bytes(_dump_json({
+            'version': ANALYSIS_CACHE_VERSION,
+            'mapping_hash': self._cache_mapping_hash,
+            'entries': self._analysis_cache
+        }, default=sorted))
+        os.replace(tmp_file, self.analysis_cache_file)
+    
+    @staticmethod
+    def _classification_from_dict(data: Dict[str, Any]) -> EnhancedClassificationResult:
+        """Rebuild a cached classification result"""
+        data = dict(data)
+        data['evidence'] = [Evidence(**e) for e in data['evidence']]
+        data['domain_scores'] = [
+            DomainScore(**{**score, 'evidence': [Evidence(**e) for e in score['evidence']]})
+            for score in data['domain_scores']
+        ]
+        data['dependencies'] = set(data['dependencies'])
+        return EnhancedClassificationResult(**data)
+    
+    def _mark_dirty(self):
+        """Record a state change, saving once enough changes have accumulated"""
+        self._dirty += 1
+        if self._dirty >= self._save_every:
+            self._save_state()
+            self._dirty = 0
+    
+    def _save_state_sync(self, blob: Optional[bytes] = None):
+        """Save migration state and fsync it (checkpoint boundaries only)"""
+        self._save_state(blob)
+        self._dirty = 0
+        
+        fd = os.open('.migration/frontend_migration_state.json', os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
     
     async def analyze_frontend(self, confidence_threshold: float = 0.7) -> FrontendMigrationPlan:
         """
         Complete frontend analysis with all enhancements
         """
-        # Suppress AMQP/RabbitMQ errors that aren't relevant
-        import logging
-        logging.getLogger('pika').setLevel(logging.WARNING)
-        logging.getLogger('pika.adapters').setLevel(logging.WARNING)
-        logging.getLogger('pika.connection').setLevel(logging.WARNING)
-        
         debug_log.api("Starting enhanced frontend analysis", level="INFO")
         
         # Get all frontend files
@@ -115,12 +299,16 @@ class FrontendMigrationOrchestrator:
         debug_log.api(f"Found {len(frontend_files)} frontend files", level="INFO")
         
         # Analyze files with progress tracking and batching
-        classifications = []
+        total = len(frontend_files)
+        classifications = [None] * total  # Pre-sized; failed slots are dropped below
         review_required = []
         
-        total = len(frontend_files)
         batch_size = 50  # Process in smaller batches to avoid overwhelming system
         
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Entries for this run only, so keys of deleted/changed files are dropped
+        fresh_cache: Dict[str, Dict[str, Any]] = {}
+        
         print(f"\nAnalyzing {total} frontend files in batches of {batch_size}...")
         
         for batch_start in range(0, total, batch_size):
@@ -131,22 +319,30 @@ class FrontendMigrationOrchestrator:
             progress = (batch_start / total) * 100
             print(f"  Progress: {batch_start}/{total} files ({progress:.1f}%)", end='\r')
             
-            # Process batch
-            for file_path in batch:
-                try:
-                    result = await self.analyzer.analyze_file(file_path)
-                    classifications.append(result)
-                    
-                    if result.requires_review:
-                        review_required.append(str(file_path))
-                        
-                except Exception as e:
-                    # Don't stop on individual file errors
-                    debug_log.api(f"Skipped {file_path.name}: {str(e)}", level="WARNING")
+            # Process batch concurrently, bounded by the semaphore
+            results = await asyncio.gather(
+                *(self._analyze_one(file_path, semaphore, fresh_cache) for file_path in batch)
+            )
+            
+            for i, (file_path, result) in enumerate(zip(batch, results), batch_start):
+                if result is None:
                     continue
+                
+                classifications[i] = result
+                
+                if result.requires_review:
+                    review_required.append(str(file_path))
         
         print(f"  Progress: {total}/{total} files (100.0%)  ")
         
+        classifications = [cls for cls in classifications if cls is not None]
+        
+        self._analysis_cache = fresh_cache
+        try:
+            self._save_analysis_cache()
+        except Exception as e:
+            debug_log.error_trace("Failed to save analysis cache", exception=e)
+        
         # Build dependency graph
         graph = await self.validator.build_dependency_graph(classifications)
         
@@ -160,18 +356,9 @@ class FrontendMigrationOrchestrator:
         import_rewrite_plan = await self.rewriter.create_rewrite_plan(file_moves)
         
         # Calculate statistics
-        domain_dist = {}
-        confidence_dist = {'high': 0, 'medium': 0, 'low': 0}
+        domain_dist = dict(Counter(cls.primary_domain for cls in classifications))
         
-        for cls in classifications:
-            domain_dist[cls.primary_domain] = domain_dist.get(cls.primary_domain, 0) + 1
-            
-            if cls.confidence >= 0.8:
-                confidence_dist['high'] += 1
-            elif cls.confidence >= 0.6:
-                confidence_dist['medium'] += 1
-            else:
-                confidence_dist['low'] += 1
+        confidence_dist = self._confidence_distribution(classifications)
         
         return FrontendMigrationPlan(
             timestamp=datetime.now().isoformat(),
@@ -185,6 +372,50 @@ class FrontendMigrationOrchestrator:
             import_rewrite_plan=import_rewrite_plan
         )
     
+    def _confidence_distribution(self, classifications: List[Any]) -> Dict[str, int]:
+        """Bucket classifications into high (>=0.8), medium (>=0.6) and low confidence"""
+        if NUMPY_AVAILABLE and len(classifications) > NUMPY_STATS_THRESHOLD:
+            confidences = np.fromiter((cls.confidence for cls in classifications),
+                                      dtype=np.float64, count=len(classifications))
+            low, medium, high = np.bincount(np.digitize(confidences, [0.6, 0.8]), minlength=3)
+            return {'high': int(high), 'medium': int(medium), 'low': int(low)}
+        
+        high = medium = low = 0
+        for cls in classifications:
+            if cls.confidence >= 0.8:
+                high += 1
+            elif cls.confidence >= 0.6:
+                medium += 1
+            else:
+                low += 1
+        return {'high': high, 'medium': medium, 'low': low}
+    
+    async def _analyze_one(self, file_path: Path, semaphore: asyncio.Semaphore,
+                           fresh_cache: Dict[str, Dict[str, Any]]) -> Optional[Any]:
+        """Analyze a single file, returning None on failure"""
+        async with semaphore:
+            try:
+                st = file_path.stat()
+                cache_key = f"{file_path}|{st.st_mtime_ns}|{st.st_size}"
+                
+                cached = self._analysis_cache.get(cache_key)
+                if cached is not None:
+                    fresh_cache[cache_key] = cached
+                    return self._classification_from_dict(cached)
+                
+                if self._pool is not None:
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(self._pool, _analyze_file_worker, file_path)
+                else:
+                    result = await self.analyzer.analyze_file(file_path)
+                
+                fresh_cache[cache_key] = asdict(result)
+                return result
+            except Exception as e:
+                # Don't stop on individual file errors
+                debug_log.api(f"Skipped {file_path.name}: {str(e)}", level="WARNING")
+                return None
+    
     def _get_frontend_files(self) -> List[Path]:
         """Get all frontend TypeScript/React files"""
         frontend_dirs = [
@@ -197,23 +428,36 @@ class FrontendMigrationOrchestrator:
         for frontend_dir in frontend_dirs:
             if frontend_dir.exists():
                 print(f"Found frontend directory: {frontend_dir}")
-                for ext in ['*.tsx', '*.ts']:
-                    matching = list(frontend_dir.rglob(ext))
-                    files.extend(matching)
-                    print(f"  Found {len(matching)} {ext} files")
+                files = list(self._walk_frontend_dir(frontend_dir))
+                print(f"  Found {len(files)} *.ts/*.tsx files")
                 break
         else:
             print("WARNING: No frontend directory found!")
             print(f"  Checked: {[str(d) for d in frontend_dirs]}")
         
-        # Filter out test files and node_modules
-        filtered = []
-        for f in files:
-            path_str = str(f)
-            if 'node_modules' not in path_str and '.test.' not in path_str and '.spec.' not in path_str:
-                filtered.append(f)
-        
-        return filtered
+        return files
+    
+    def _walk_frontend_dir(self, root: Path):
+        """
+        Yield TypeScript/React source files under root, skipping test files.
+        node_modules and build output directories are pruned without descending.
+        """
+        stack = [str(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in PRUNED_FRONTEND_DIRS:
+                            stack.append(entry.path)
+                    elif (name.endswith(('.ts', '.tsx'))
+                          and '.test.' not in name and '.spec.' not in name):
+                        yield Path(entry.path)
     
     def _generate_file_moves(self, classifications: List[Any]) -> List[FileMove]:
         """Generate file moves based on domain classifications"""
@@ -245,36 +489,28 @@ class FrontendMigrationOrchestrator:
     def _calculate_target_path(self, current_path: Path, domain: str) -> Optional[Path]:
         """Calculate target path for domain organization"""
         # Get base client directory
-        path_str = str(current_path)
+        parts = current_path.parts
         
-        if '/client/src/' in path_str:
-            base_dir = path_str.split('/client/src/')[0] + '/client/src'
+        # Anchor on the first client/src pair that has a file beneath it
+        for i in range(len(parts) - 2):
+            if parts[i] == 'client' and parts[i + 1] == 'src':
+                break
         else:
             return None
         
-        # Get relative path from src
-        rel_path = current_path.relative_to(Path(base_dir))
+        base_dir = Path(*parts[:i + 2])
         
-        # Determine subdirectory based on file type
+        # Determine subdirectory based on file type (first matching rule wins)
         file_name = current_path.name
         
-        if 'component' in file_name.lower() or current_path.suffix == '.tsx':
-            subdir = 'components'
-        elif 'service' in file_name.lower() or 'api' in file_name.lower():
-            subdir = 'services'  
-        elif 'hook' in file_name.lower() or file_name.startswith('use'):
-            subdir = 'hooks'
-        elif 'context' in file_name.lower():
-            subdir = 'contexts'
-        elif 'util' in file_name.lower() or 'helper' in file_name.lower():
-            subdir = 'utils'
-        elif 'type' in file_name.lower() or '.d.ts' in file_name:
-            subdir = 'types'
-        else:
-            subdir = 'misc'
+        subdir = 'misc'
+        for pattern, rule_subdir in TARGET_SUBDIR_RULES:
+            if pattern.search(file_name):
+                subdir = rule_subdir
+                break
         
         # Build target path
-        target = Path(base_dir) / 'domains' / domain / subdir / file_name
+        target = base_dir / 'domains' / domain / subdir / file_name
         
         return target
     
@@ -302,26 +538,43 @@ class FrontendMigrationOrchestrator:
         try:
             # Phase 1: Move files
             debug_log.api("Phase 1: Moving files", level="INFO")
-            for move in plan.file_moves:
-                # Skip if already completed (idempotency)
-                move_id = f"{move.from_path}->{move.to_path}"
-                if move_id in self.state.completed_moves:
-                    continue
+            
+            # Skip moves already completed (idempotency)
+            completed = set(self.state.completed_moves)
+            pending = [move for move in plan.file_moves
+                       if f"{move.from_path}->{move.to_path}" not in completed]
+            
+            # Create every target directory once up front rather than per move
+            for target_dir in {Path(move.to_path).parent for move in pending}:
+                target_dir.mkdir(parents=True, exist_ok=True)
+            
+            semaphore = asyncio.Semaphore(16)  # Cap open files during concurrent moves
+            move_batch_size = 64
+            
+            for batch_start in range(0, len(pending), move_batch_size):
+                batch = pending[batch_start:batch_start + move_batch_size]
+                outcomes = await asyncio.gather(
+                    *(self._move_file_async(move, semaphore) for move in batch)
+                )
                 
-                try:
-                    self._move_file(move)
-                    results['files_moved'] += 1
-                    results['rollback_data'][move.to_path] = move.from_path
-                    self.state.completed_moves.append(move_id)
-                    self.state.rollback_data[move.to_path] = move.from_path
+                for move, error in outcomes:
+                    move_id = f"{move.from_path}->{move.to_path}"
                     
-                except Exception as e:
-                    debug_log.error_trace(f"Failed to move {move.from_path}", exception=e)
-                    results['errors'].append(str(e))
-                    self.state.failed_moves.append(move_id)
+                    if error is None:
+                        results['files_moved'] += 1
+                        results['rollback_data'][move.to_path] = move.from_path
+                        self.state.completed_moves.append(move_id)
+                        self.state.rollback_data[move.to_path] = move.from_path
+                    else:
+                        debug_log.error_trace(f"Failed to move {move.from_path}", exception=error)
+                        results['errors'].append(str(error))
+                        self.state.failed_moves.append(move_id)
+                    
+                    self._mark_dirty()
             
             # Save state after moves
             self._save_state()
+            self._dirty = 0
             
             # Phase 2: Update imports
             debug_log.api("Phase 2: Updating imports", level="INFO")
@@ -347,36 +600,49 @@ class FrontendMigrationOrchestrator:
     
     def _create_checkpoint(self) -> str:
         """Create a checkpoint for rollback"""
-        checkpoint_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        checkpoint_id = str(time.time_ns() // 1_000_000)  # Epoch milliseconds
         checkpoint_dir = self.migration_dir / f'checkpoint_{checkpoint_id}'
         checkpoint_dir.mkdir(exist_ok=True)
         
-        # Save current state
+        # One in-memory snapshot feeds both the checkpoint and the main state file
+        self.state.last_checkpoint = checkpoint_id
+        state_data = self._state_data()
+        
         state_file = checkpoint_dir / 'state.json'
-        state_file.write_text(json.dumps({
+        state_file.write_bytes(_dump_json({
             'checkpoint_id': checkpoint_id,
-            'timestamp': datetime.now().isoformat(),
-            'state': {
-                'completed_moves': self.state.completed_moves,
-                'rollback_data': self.state.rollback_data
-            }
-        }, indent=2))
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'state': state_data
+        }))
         
-        self.state.last_checkpoint = checkpoint_id
-        self._save_state()
+        self._save_state_sync(_dump_json(state_data, indent=True))
         
         return checkpoint_id
     
+    async def _move_file_async(self, move: FileMove, semaphore: asyncio.Semaphore,
+                               retries: int = 3) -> Tuple[FileMove, Optional[Exception]]:
+        """Move a file in a worker thread, retrying transient OS errors with backoff"""
+        async with semaphore:
+            delay = 0.05
+            for attempt in range(retries):
+                try:
+                    await asyncio.to_thread(self._move_file, move)
+                    return move, None
+                except OSError as e:
+                    if e.errno not in TRANSIENT_MOVE_ERRNOS or attempt == retries - 1:
+                        return move, e
+                    await asyncio.sleep(delay)
+                    delay *= 2
+                except Exception as e:
+                    return move, e
+    
     def _move_file(self, move: FileMove):
-        """Execute a single file move"""
+        """Execute a single file move (target directory must already exist)"""
         source = Path(move.from_path)
         target = Path(move.to_path)
         
-        # Create target directory
-        target.parent.mkdir(parents=True, exist_ok=True)
-        
         # Move file
-        shutil.move(str(source), str(target))
+        _replace_or_move(str(source), str(target))
         
         # Move associated files (tests, styles, etc.)
         self._move_associated_files(source, target)
@@ -384,26 +650,28 @@ class FrontendMigrationOrchestrator:
     def _move_associated_files(self, source: Path, target: Path):
         """Move associated test files, styles, etc."""
         source_dir = source.parent
-        source_stem = source.stem
-        
-        # Patterns for associated files
-        patterns = [
-            f"{source_stem}.test.*",
-            f"{source_stem}.spec.*",
-            f"{source_stem}.module.*",
-            f"{source_stem}.css",
-            f"{source_stem}.scss",
-            f"{source_stem}.styles.*"
-        ]
+        prefix = f"{source.stem}."
         
-        for pattern in patterns:
-            for associated in source_dir.glob(pattern):
-                target_file = target.parent / associated.name
-                try:
-                    shutil.move(str(associated), str(target_file))
-                    debug_log.api(f"Moved associated file: {associated.name}", level="DEBUG")
-                except Exception as e:
-                    debug_log.error_trace(f"Failed to move associated file {associated}", exception=e)
+        # Single directory scan, matched in memory against the associated-file patterns:
+        # <stem>.test.*, <stem>.spec.*, <stem>.module.*, <stem>.styles.*, <stem>.css, <stem>.scss
+        try:
+            with os.scandir(source_dir) as entries:
+                associated = [
+                    entry.name for entry in entries
+                    if entry.name.startswith(prefix)
+                    and (entry.name[len(prefix):].startswith(ASSOCIATED_FILE_PREFIXES)
+                         or entry.name[len(prefix):] in ASSOCIATED_FILE_SUFFIXES)
+                ]
+        except OSError as e:
+            debug_log.error_trace(f"Failed to scan {source_dir} for associated files", exception=e)
+            return
+        
+        for name in associated:
+            try:
+                _replace_or_move(str(source_dir / name), str(target.parent / name))
+                debug_log.api(f"Moved associated file: {name}", level="DEBUG")
+            except Exception as e:
+                debug_log.error_trace(f"Failed to move associated file {source_dir / name}", exception=e)
     
     def _simulate_migration(self, plan: FrontendMigrationPlan) -> Dict[str, Any]:
         """Simulate migration without making changes"""
@@ -437,11 +705,21 @@ class FrontendMigrationOrchestrator:
             'errors': []
         }
         
-        # Check all files exist in new locations
+        # Check all files exist in new locations - one listing per target directory
+        moves_by_dir: Dict[str, List[FileMove]] = defaultdict(list)
         for move in plan.file_moves:
-            if not Path(move.to_path).exists():
-                validation['is_valid'] = False
-                validation['errors'].append(f"File not found: {move.to_path}")
+            moves_by_dir[os.path.dirname(move.to_path)].append(move)
+        
+        for target_dir, moves in moves_by_dir.items():
+            try:
+                present = set(os.listdir(target_dir or os.curdir))
+            except OSError:
+                present = set()
+            
+            for move in moves:
+                if os.path.basename(move.to_path) not in present:
+                    validation['is_valid'] = False
+                    validation['errors'].append(f"File not found: {move.to_path}")
         
         # Validate imports
         affected_files = list(plan.import_rewrite_plan.affected_files)
@@ -474,7 +752,7 @@ class FrontendMigrationOrchestrator:
                 try:
                     # Move back to original location
                     Path(original_path).parent.mkdir(parents=True, exist_ok=True)
-                    shutil.move(new_path, original_path)
+                    _replace_or_move(new_path, original_path)
                     debug_log.api(f"Rolled back: {new_path} -> {original_path}", level="INFO")
                 except Exception as e:
                     debug_log.error_trace(f"Failed to rollback {new_path}", exception=e)
@@ -482,7 +760,7 @@ class FrontendMigrationOrchestrator:
         # Reset state
         self.state.completed_moves = checkpoint_data['state']['completed_moves']
         self.state.rollback_data = {}
-        self._save_state()
+        self._save_state_sync()
         
         debug_log.api("Rollback completed", level="INFO")
     
@@ -501,45 +779,47 @@ class FrontendMigrationOrchestrator:
     def generate_migration_report(self, plan: FrontendMigrationPlan) -> str:
         """Generate comprehensive migration report"""
         report = []
-        report.append("# Frontend Migration Report")
-        report.append(f"Generated: {plan.timestamp}\n")
+        append = report.append  # Bound once; the report can run to thousands of lines
         
-        report.append("## Summary")
-        report.append(f"- Total Files: {plan.total_files}")
-        report.append(f"- Files to Move: {len(plan.file_moves)}")
-        report.append(f"- Review Required: {len(plan.review_required)}")
-        report.append(f"- Import Updates: {plan.import_rewrite_plan.total_updates}\n")
+        append("# Frontend Migration Report")
+        append(f"Generated: {plan.timestamp}\n")
         
-        report.append("## Domain Distribution")
-        for domain, count in sorted(plan.domain_distribution.items(), key=lambda x: x[1], reverse=True):
-            report.append(f"- {domain}: {count} files")
+        append("## Summary")
+        append(f"- Total Files: {plan.total_files}")
+        append(f"- Files to Move: {len(plan.file_moves)}")
+        append(f"- Review Required: {len(plan.review_required)}")
+        append(f"- Import Updates: {plan.import_rewrite_plan.total_updates}\n")
         
-        report.append("\n## Confidence Distribution")
+        append("## Domain Distribution")
+        for domain, count in sorted(plan.domain_distribution.items(), key=itemgetter(1), reverse=True):
+            append(f"- {domain}: {count} files")
+        
+        append("\n## Confidence Distribution")
         for level, count in plan.confidence_distribution.items():
-            report.append(f"- {level}: {count} files")
+            append(f"- {level}: {count} files")
         
-        report.append("\n## Validation Results")
-        report.append(f"- Valid: {plan.validation_report.is_valid}")
-        report.append(f"- Domain Violations: {len(plan.validation_report.domain_violations)}")
-        report.append(f"- Circular Dependencies: {len(plan.validation_report.cyclic_dependencies)}")
-        report.append(f"- Can Proceed: {plan.validation_report.can_proceed_with_warnings}")
+        append("\n## Validation Results")
+        append(f"- Valid: {plan.validation_report.is_valid}")
+        append(f"- Domain Violations: {len(plan.validation_report.domain_violations)}")
+        append(f"- Circular Dependencies: {len(plan.validation_report.cyclic_dependencies)}")
+        append(f"- Can Proceed: {plan.validation_report.can_proceed_with_warnings}")
         
         if plan.validation_report.domain_violations:
-            report.append("\n### Domain Violations (Top 10)")
+            append("\n### Domain Violations (Top 10)")
             for v in plan.validation_report.domain_violations[:10]:
-                report.append(f"- [{v.severity}] {v.description}")
+                append(f"- [{v.severity}] {v.description}")
         
         if plan.validation_report.cyclic_dependencies:
-            report.append("\n### Circular Dependencies")
+            append("\n### Circular Dependencies")
             for c in plan.validation_report.cyclic_dependencies[:5]:
-                report.append(f"- {c.description}")
+                append(f"- {c.description}")
         
-        report.append("\n## Files Requiring Review")
+        append("\n## Files Requiring Review")
         for file in plan.review_required[:20]:
-            report.append(f"- {file}")
+            append(f"- {file}")
         
         if len(plan.review_required) > 20:
-            report.append(f"... and {len(plan.review_required) - 20} more")
+            append(f"... and {len(plan.review_required) - 20} more")
         
         return '\n'.join(report)
 
@@ -550,76 +830,74 @@ def integrate_with_mams_orchestrator():
     Function to be called from existing MAMS orchestrator
     """
     async def process_frontend_enhanced():
-        orchestrator = FrontendMigrationOrchestrator()
-        
-        # Analyze
-        plan = await orchestrator.analyze_frontend()
-        
-        # Generate report
-        report = orchestrator.generate_migration_report(plan)
-        report_path = Path('/app/.migration/frontend_migration_report.md')
-        report_path.write_text(report)
-        
-        # Generate review UI if needed
-        if plan.review_required:
-            ui_path = await orchestrator.generate_review_ui(plan)
-            debug_log.api(f"Review UI generated: {ui_path}", level="INFO")
-        
-        return {
-            'plan': plan,
-            'report_path': str(report_path),
-            'statistics': {
-                'total_files': plan.total_files,
-                'moves_planned': len(plan.file_moves),
-                'review_required': len(plan.review_required),
-                'is_valid': plan.validation_report.is_valid
+        with FrontendMigrationOrchestrator() as orchestrator:
+            # Analyze
+            plan = await orchestrator.analyze_frontend()
+            
+            # Generate report
+            report = orchestrator.generate_migration_report(plan)
+            report_path = Path('/app/.migration/frontend_migration_report.md')
+            report_path.write_text(report)
+            
+            # Generate review UI if needed
+            if plan.review_required:
+                ui_path = await orchestrator.generate_review_ui(plan)
+                debug_log.api(f"Review UI generated: {ui_path}", level="INFO")
+            
+            return {
+                'plan': plan,
+                'report_path': str(report_path),
+                'statistics': {
+                    'total_files': plan.total_files,
+                    'moves_planned': len(plan.file_moves),
+                    'review_required': len(plan.review_required),
+                    'is_valid': plan.validation_report.is_valid
+                }
             }
-        }
     
     return process_frontend_enhanced
 
 
 if __name__ == "__main__":
     async def test_orchestrator():
-        orchestrator = FrontendMigrationOrchestrator()
-        
-        # Analyze frontend
-        print("Analyzing frontend files...")
-        plan = await orchestrator.analyze_frontend()
-        
-        print(f"\nAnalysis Complete:")
-        print(f"  Total Files: {plan.total_files}")
-        print(f"  Files to Move: {len(plan.file_moves)}")
-        print(f"  Review Required: {len(plan.review_required)}")
-        
-        print(f"\nDomain Distribution:")
-        for domain, count in sorted(plan.domain_distribution.items(), 
-                                   key=lambda x: x[1], reverse=True)[:10]:
-            print(f"  {domain}: {count}")
-        
-        print(f"\nConfidence Distribution:")
-        for level, count in plan.confidence_distribution.items():
-            print(f"  {level}: {count}")
-        
-        print(f"\nValidation Results:")
-        print(f"  Valid: {plan.validation_report.is_valid}")
-        print(f"  Can Proceed: {plan.validation_report.can_proceed_with_warnings}")
-        
-        # Generate report
-        report = orchestrator.generate_migration_report(plan)
-        print(f"\nReport generated ({len(report)} characters)")
-        
-        # Simulate migration
-        print(f"\nSimulating migration...")
-        results = await orchestrator.execute_migration(plan, dry_run=True)
-        print(f"Simulation Results:")
-        for key, value in results.items():
-            if isinstance(value, dict):
-                print(f"  {key}:")
-                for k, v in value.items():
-                    print(f"    {k}: {v}")
-            else:
-                print(f"  {key}: {value}")
+        with FrontendMigrationOrchestrator() as orchestrator:
+            # Analyze frontend
+            print("Analyzing frontend files...")
+            plan = await orchestrator.analyze_frontend()
+            
+            print(f"\nAnalysis Complete:")
+            print(f"  Total Files: {plan.total_files}")
+            print(f"  Files to Move: {len(plan.file_moves)}")
+            print(f"  Review Required: {len(plan.review_required)}")
+            
+            print(f"\nDomain Distribution:")
+            for domain, count in sorted(plan.domain_distribution.items(), 
+                                       key=lambda x: x[1], reverse=True)[:10]:
+                print(f"  {domain}: {count}")
+            
+            print(f"\nConfidence Distribution:")
+            for level, count in plan.confidence_distribution.items():
+                print(f"  {level}: {count}")
+            
+            print(f"\nValidation Results:")
+            print(f"  Valid: {plan.validation_report.is_valid}")
+            print(f"  Can Proceed: {plan.validation_report.can_proceed_with_warnings}")
+            
+            # Generate report
+            report = orchestrator.generate_migration_report(plan)
+            print(f"\nReport generated ({len(report)} characters)")
+            
+            # Simulate migration
+            print(f"\nSimulating migration...")
+            results = await orchestrator.execute_migration(plan, dry_run=True)
+            print(f"Simulation Results:")
+            for key, value in results.items():
+                if isinstance(value, dict):
+                    print(f"  {key}:")
+                    for k, v in value.items():
+                        print(f"    {k}: {v}")
+                else:
+                    print(f"  {key}: {value}")
     
     # Run test
     asyncio.run(test_orchestrator())
\ No newline at end of file
@@ -4,12 +4,32 @@ MAMS-018: Interactive Review UI Generator
 Generates interactive HTML UI for reviewing low-confidence classifications
 """
 
+import asyncio
+import gzip
+import io
 import json
+import re
+import time
 from pathlib import Path
-from typing import List, Any, Dict
-from datetime import datetime
+from typing import List, Any, Dict, Final
+from itertools import islice
 from dataclasses import dataclass
 
+import jinja2
+from markupsafe import Markup
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent paths for imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -17,296 +37,281 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from arkyvus.utils.debug_logger import debug_log
 
 
-class ReviewUIGenerator:
-    """
-    Generates interactive HTML UI for manual review of classifications
-    """
-    
-    def __init__(self):
-        self.output_dir = Path('/app/.migration/review_ui')
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-    async def generate_review_interface(self, classifications: List[Any], 
-                                       validation_report: Any) -> str:
-        """Generate interactive review UI"""
-        debug_log.api("Generating review UI", level="INFO")
-        
-        # Filter for low-confidence items
-        review_items = [c for c in classifications if c.requires_review]
-        
-        # Generate HTML
-        html_content = self._generate_html(review_items, validation_report)
-        
-        # Save to file
-        output_file = self.output_dir / f'review_{datetime.now().strftime("%Y%m%d_%H%M%S")}.html'
-        output_file.write_text(html_content)
-        
-        debug_log.api(f"Review UI generated: {output_file}", level="INFO")
-        return str(output_file)
-    
-    def _generate_html(self, review_items: List[Any], validation_report: Any) -> str:
-        """Generate HTML content for review UI"""
-        
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MAMS Frontend Classification Review</title>
-    <style>
-        * {{
+# Domains offered as reassignment targets on every review card
+ALL_DOMAINS: Final[tuple[str, ...]] = ('auth', 'ai', 'brand', 'content', 'messaging', 'analytics',
+                                      'business', 'storage', 'workflow', 'ui', 'shared', 'platform')
+
+# Review pages at least this large (in characters) also get a gzip-compressed copy
+COMPRESS_THRESHOLD: Final[int] = 256 * 1024
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse the whitespace around CSS punctuation"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,])\s*', r'\1', css)
+    return css.replace(': ', ':').replace(';}', '}').strip()
+
+
+def _minify_js(js: str) -> str:
+    """Drop indentation, blank lines and whole-line comments; line breaks are kept for ASI"""
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+# Static page assets - minified once at import and bound into the template as trusted markup
+_STYLES: Final[str] = _minify_css("""
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
         
-        .header {{
+        .header {
             background: white;
             border-radius: 12px;
             padding: 30px;
             margin-bottom: 30px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             color: #2d3748;
             margin-bottom: 10px;
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 2em;
             font-weight: bold;
             color: #667eea;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             color: #718096;
             margin-top: 5px;
-        }}
+        }
         
-        .filters {{
+        .filters {
             background: white;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 20px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .filter-group {{
+        .filter-group {
             display: inline-block;
             margin-right: 20px;
-        }}
+        }
         
-        .filter-group label {{
+        .filter-group label {
             display: block;
             color: #4a5568;
             margin-bottom: 5px;
             font-weight: 600;
-        }}
+        }
         
         .filter-group select,
-        .filter-group input {{
+        .filter-group input {
             padding: 8px 12px;
             border: 1px solid #cbd5e0;
             border-radius: 4px;
             background: white;
-        }}
+        }
         
-        .review-items {{
+        .review-items {
             display: grid;
             gap: 20px;
-        }}
+        }
         
-        .review-card {{
+        .review-card {
             background: white;
             border-radius: 8px;
             overflow: hidden;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             transition: transform 0.2s, box-shadow 0.2s;
-        }}
+        }
         
-        .review-card:hover {{
+        .review-card:hover {
             transform: translateY(-2px);
             box-shadow: 0 8px 12px rgba(0,0,0,0.15);
-        }}
+        }
         
-        .review-header {{
+        .review-header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 15px 20px;
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
+        }
         
-        .file-path {{
+        .file-path {
             font-family: 'Monaco', 'Menlo', monospace;
             font-size: 0.9em;
             word-break: break-all;
-        }}
+        }
         
-        .confidence-badge {{
+        .confidence-badge {
             background: rgba(255,255,255,0.2);
             padding: 4px 12px;
             border-radius: 20px;
             font-weight: bold;
-        }}
+        }
         
-        .confidence-low {{ background: #f56565; }}
-        .confidence-medium {{ background: #ed8936; }}
-        .confidence-high {{ background: #48bb78; }}
+        .confidence-low { background: #f56565; }
+        .confidence-medium { background: #ed8936; }
+        .confidence-high { background: #48bb78; }
         
-        .review-body {{
+        .review-body {
             padding: 20px;
-        }}
+        }
         
-        .domain-section {{
+        .domain-section {
             margin-bottom: 20px;
-        }}
+        }
         
-        .domain-label {{
+        .domain-label {
             color: #718096;
             font-weight: 600;
             margin-bottom: 10px;
-        }}
+        }
         
-        .domain-options {{
+        .domain-options {
             display: flex;
             flex-wrap: wrap;
             gap: 10px;
-        }}
+        }
         
-        .domain-option {{
+        .domain-option {
             padding: 8px 16px;
             border: 2px solid #e2e8f0;
             border-radius: 6px;
             background: white;
             cursor: pointer;
             transition: all 0.2s;
-        }}
+        }
         
-        .domain-option:hover {{
+        .domain-option:hover {
             border-color: #667eea;
             background: #f7fafc;
-        }}
+        }
         
-        .domain-option.selected {{
+        .domain-option.selected {
             background: #667eea;
             color: white;
             border-color: #667eea;
-        }}
+        }
         
-        .domain-option.current {{
+        .domain-option.current {
             background: #edf2f7;
             border-color: #cbd5e0;
-        }}
+        }
         
-        .evidence-section {{
+        .evidence-section {
             background: #f7fafc;
             padding: 15px;
             border-radius: 6px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .evidence-title {{
+        .evidence-title {
             font-weight: 600;
             color: #4a5568;
             margin-bottom: 10px;
-        }}
+        }
         
-        .evidence-item {{
+        .evidence-item {
             display: flex;
             justify-content: space-between;
             padding: 5px 0;
             border-bottom: 1px solid #e2e8f0;
-        }}
+        }
         
-        .evidence-item:last-child {{
+        .evidence-item:last-child {
             border-bottom: none;
-        }}
+        }
         
-        .evidence-type {{
+        .evidence-type {
             color: #718096;
             font-size: 0.9em;
-        }}
+        }
         
-        .evidence-value {{
+        .evidence-value {
             color: #2d3748;
             font-weight: 500;
-        }}
+        }
         
-        .review-actions {{
+        .review-actions {
             display: flex;
             gap: 10px;
             padding: 15px 20px;
             background: #f7fafc;
             border-top: 1px solid #e2e8f0;
-        }}
+        }
         
-        .btn {{
+        .btn {
             padding: 10px 20px;
             border: none;
             border-radius: 6px;
             font-weight: 600;
             cursor: pointer;
             transition: all 0.2s;
-        }}
+        }
         
-        .btn-primary {{
+        .btn-primary {
             background: #667eea;
             color: white;
-        }}
+        }
         
-        .btn-primary:hover {{
+        .btn-primary:hover {
             background: #5a67d8;
-        }}
+        }
         
-        .btn-secondary {{
+        .btn-secondary {
             background: #e2e8f0;
             color: #4a5568;
-        }}
+        }
         
-        .btn-secondary:hover {{
+        .btn-secondary:hover {
             background: #cbd5e0;
-        }}
+        }
         
-        .btn-danger {{
+        .btn-danger {
             background: #f56565;
             color: white;
-        }}
+        }
         
-        .btn-danger:hover {{
+        .btn-danger:hover {
             background: #e53e3e;
-        }}
+        }
         
-        .bulk-actions {{
+        .bulk-actions {
             position: fixed;
             bottom: 20px;
             right: 20px;
@@ -315,402 +320,528 @@ class ReviewUIGenerator:
             border-radius: 8px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
             display: none;
-        }}
+        }
         
-        .bulk-actions.show {{
+        .bulk-actions.show {
             display: block;
-        }}
+        }
         
-        .review-reasons {{
+        .review-reasons {
             background: #fff5f5;
             border: 1px solid #feb2b2;
             border-radius: 6px;
             padding: 10px 15px;
             margin-bottom: 15px;
-        }}
+        }
         
-        .review-reason {{
+        .review-reason {
             color: #c53030;
             margin: 5px 0;
-        }}
+        }
         
-        .dependencies-list {{
+        .dependencies-list {
             background: #f0fff4;
             border: 1px solid #9ae6b4;
             border-radius: 6px;
             padding: 10px 15px;
             margin-bottom: 15px;
-        }}
+        }
         
-        .dependency-item {{
+        .dependency-item {
             color: #22543d;
             font-family: monospace;
             font-size: 0.9em;
             margin: 5px 0;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>MAMS Frontend Classification Review</h1>
-            <p style="color: #718096; margin-top: 10px;">
-                Review and correct low-confidence domain classifications
-            </p>
-        </div>
-        
-        <div class="stats">
-            <div class="stat-card">
-                <div class="stat-value">{len(review_items)}</div>
-                <div class="stat-label">Items to Review</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{len([i for i in review_items if i.confidence < 0.5])}</div>
-                <div class="stat-label">Low Confidence</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{len([i for i in review_items if 0.5 <= i.confidence < 0.7])}</div>
-                <div class="stat-label">Medium Confidence</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{len(validation_report.domain_violations)}</div>
-                <div class="stat-label">Domain Violations</div>
-            </div>
-        </div>
-        
-        <div class="filters">
-            <div class="filter-group">
-                <label>Filter by Domain</label>
-                <select id="domainFilter">
-                    <option value="">All Domains</option>
-                    {self._generate_domain_options(review_items)}
-                </select>
-            </div>
-            <div class="filter-group">
-                <label>Filter by Confidence</label>
-                <select id="confidenceFilter">
-                    <option value="">All</option>
-                    <option value="low">Low (&lt; 0.5)</option>
-                    <option value="medium">Medium (0.5 - 0.7)</option>
-                    <option value="high">High (&gt; 0.7)</option>
-                </select>
-            </div>
-            <div class="filter-group">
-                <label>Search Files</label>
-                <input type="text" id="searchFilter" placeholder="Search file paths...">
-            </div>
-        </div>
-        
-        <div class="review-items">
-            {self._generate_review_cards(review_items)}
-        </div>
-        
-        <div class="bulk-actions" id="bulkActions">
-            <h3 style="margin-bottom: 15px;">Bulk Actions</h3>
-            <p id="selectedCount">0 items selected</p>
-            <div style="margin-top: 15px;">
-                <button class="btn btn-primary" onclick="applyBulkChanges()">Apply Changes</button>
-                <button class="btn btn-secondary" onclick="clearSelection()">Clear Selection</button>
-            </div>
-        </div>
-    </div>
-    
-    <script>
+        }
+""")
+
+_SCRIPT: Final[str] = _minify_js("""
         let selectedItems = new Set();
-        let changes = {{}};
-        
-        function selectDomain(cardId, domain) {{
+        let changes = {};
+        
+        // Cards are built here from the embedded JSON payload rather than server-side
+        const PAGE_SIZE = 200;
+        let reviewData = { all_domains: [], items: [] };
+        let renderedCount = 0;
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        
+        function escapeHtml(value) {
+            return String(value).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }
+        
+        function confidenceClass(confidence) {
+            if (confidence < 0.5) return 'confidence-low';
+            if (confidence < 0.7) return 'confidence-medium';
+            return 'confidence-high';
+        }
+        
+        function renderCard(item, allDomains) {
+            const cardId = `card_${item.id}`;
+            const secondary = new Set(item.secondary_domains);
+            const name = item.file_path.split('/').pop() || item.file_path;
+            // Fragments are appended to one string rather than mapped into arrays and joined
+            let reasons = '';
+            for (const reason of item.review_reasons) {
+                reasons += `<div class="review-reason">• ${escapeHtml(reason)}</div>`;
+            }
+            if (reasons) reasons = `<div class="review-reasons">${reasons}</div>`;
+            let options = '';
+            for (const domain of allDomains) {
+                const state = domain === item.primary_domain ? ' current' : secondary.has(domain) ? ' secondary' : '';
+                options += `<div class="domain-option${state}" data-domain="${domain}" onclick="selectDomain('${cardId}', '${domain}')">${domain}</div>`;
+            }
+            let evidence = '';
+            for (const ev of item.evidence) {
+                evidence += `<div class="evidence-item"><span class="evidence-type">${
+                    escapeHtml(ev.type)}</span><span class="evidence-value">${escapeHtml(ev.value)}</span></div>`;
+            }
+            let dependencies = '';
+            for (const dep of item.dependencies) {
+                dependencies += `<div class="dependency-item">• ${escapeHtml(dep)}</div>`;
+            }
+            if (dependencies) dependencies = `<div class="dependencies-list"><div class="evidence-title">Dependencies</div>${dependencies}</div>`;
+            return `<div class="review-card" id="${cardId}" data-filepath="${escapeHtml(item.file_path)}" data-current-domain="${
+                escapeHtml(item.primary_domain)}" data-confidence="${item.confidence}">
+                <div class="review-header"><div class="file-path">${escapeHtml(name)}</div>
+                <div class="confidence-badge ${confidenceClass(item.confidence)}">${item.confidence.toFixed(2)}</div></div>
+                <div class="review-body">${reasons}
+                <div class="domain-section"><div class="domain-label">Current: ${escapeHtml(item.primary_domain)}</div>
+                <div class="domain-options">${options}</div></div>
+                <div class="evidence-section"><div class="evidence-title">Evidence</div>${evidence}</div>${dependencies}</div>
+                <div class="review-actions">
+                <button class="btn btn-primary" onclick="approveClassification('${cardId}')">Approve</button>
+                <button class="btn btn-secondary" onclick="skipClassification('${cardId}')">Skip</button>
+                <button class="btn btn-danger" onclick="flagForManual('${cardId}')">Flag</button>
+                </div></div>`;
+        }
+        
+        function loadMore() {
+            const items = reviewData.items;
+            const end = Math.min(renderedCount + PAGE_SIZE, items.length);
+            const html = items.slice(renderedCount, end).map(item => renderCard(item, reviewData.all_domains)).join('');
+            document.getElementById('reviewItems').insertAdjacentHTML('beforeend', html);
+            renderedCount = end;
+            
+            const remaining = items.length - renderedCount;
+            const button = document.getElementById('loadMore');
+            button.textContent = `Show next ${Math.min(PAGE_SIZE, remaining)}`;
+            button.style.display = remaining > 0 ? 'block' : 'none';
+            filterCards();
+        }
+        
+        function renderCards(data) {
+            reviewData = data;
+            loadMore();
+            if (renderedCount >= data.items.length || !('IntersectionObserver' in window)) return;
+            
+            // Further pages also load automatically as the "load more" button scrolls into view
+            const button = document.getElementById('loadMore');
+            const observer = new IntersectionObserver(entries => {
+                if (!entries[0].isIntersecting) return;
+                loadMore();
+                observer.unobserve(button);
+                if (renderedCount < data.items.length) observer.observe(button);
+            }, { rootMargin: '800px' });
+            observer.observe(button);
+        }
+        
+        function selectDomain(cardId, domain) {
             const card = document.getElementById(cardId);
             const options = card.querySelectorAll('.domain-option');
             
-            options.forEach(opt => {{
+            options.forEach(opt => {
                 opt.classList.remove('selected');
-                if (opt.dataset.domain === domain) {{
+                if (opt.dataset.domain === domain) {
                     opt.classList.add('selected');
-                }}
-            }});
+                }
+            });
             
-            changes[cardId] = {{ domain: domain }};
+            changes[cardId] = { domain: domain };
             updateBulkActions();
-        }}
+        }
         
-        function approveClassification(cardId) {{
+        function approveClassification(cardId) {
             const card = document.getElementById(cardId);
             const currentDomain = card.dataset.currentDomain;
             
-            changes[cardId] = {{ 
+            changes[cardId] = { 
                 domain: currentDomain, 
                 approved: true 
-            }};
+            };
             
             card.style.opacity = '0.7';
             card.style.background = '#f0fff4';
             updateBulkActions();
-        }}
+        }
         
-        function skipClassification(cardId) {{
+        function skipClassification(cardId) {
             const card = document.getElementById(cardId);
             card.style.opacity = '0.5';
             
-            if (changes[cardId]) {{
+            if (changes[cardId]) {
                 delete changes[cardId];
-            }}
+            }
             updateBulkActions();
-        }}
+        }
         
-        function flagForManual(cardId) {{
+        function flagForManual(cardId) {
             const card = document.getElementById(cardId);
             
-            changes[cardId] = {{ 
+            changes[cardId] = { 
                 flagged: true,
                 reason: prompt('Reason for flagging:')
-            }};
+            };
             
             card.style.borderLeft = '5px solid #f56565';
             updateBulkActions();
-        }}
+        }
         
-        function updateBulkActions() {{
+        function updateBulkActions() {
             const count = Object.keys(changes).length;
             const bulkActions = document.getElementById('bulkActions');
             const selectedCount = document.getElementById('selectedCount');
             
-            if (count > 0) {{
+            if (count > 0) {
                 bulkActions.classList.add('show');
-                selectedCount.textContent = `${{count}} items with changes`;
-            }} else {{
+                selectedCount.textContent = `${count} items with changes`;
+            } else {
                 bulkActions.classList.remove('show');
-            }}
-        }}
+            }
+        }
         
-        function applyBulkChanges() {{
-            const result = {{
+        function applyBulkChanges() {
+            const result = {
                 timestamp: new Date().toISOString(),
                 changes: changes
-            }};
+            };
             
             // Save to localStorage for persistence
             localStorage.setItem('mams_review_changes', JSON.stringify(result));
             
             // Generate download
             const blob = new Blob([JSON.stringify(result, null, 2)], 
-                                 {{ type: 'application/json' }});
+                                 { type: 'application/json' });
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
-            a.download = `mams_review_${{Date.now()}}.json`;
+            a.download = `mams_review_${Date.now()}.json`;
             a.click();
             
-            alert(`Changes saved for ${{Object.keys(changes).length}} items`);
-        }}
+            alert(`Changes saved for ${Object.keys(changes).length} items`);
+        }
         
-        function clearSelection() {{
-            changes = {{}};
-            document.querySelectorAll('.review-card').forEach(card => {{
+        function clearSelection() {
+            changes = {};
+            document.querySelectorAll('.review-card').forEach(card => {
                 card.style.opacity = '1';
                 card.style.background = 'white';
                 card.style.borderLeft = 'none';
-            }});
+            });
             updateBulkActions();
-        }}
+        }
         
         // Filtering
         document.getElementById('domainFilter').addEventListener('change', filterCards);
         document.getElementById('confidenceFilter').addEventListener('change', filterCards);
         document.getElementById('searchFilter').addEventListener('input', filterCards);
         
-        function filterCards() {{
+        function filterCards() {
             const domainFilter = document.getElementById('domainFilter').value;
             const confidenceFilter = document.getElementById('confidenceFilter').value;
             const searchFilter = document.getElementById('searchFilter').value.toLowerCase();
             
-            document.querySelectorAll('.review-card').forEach(card => {{
+            document.querySelectorAll('.review-card').forEach(card => {
                 let show = true;
                 
-                if (domainFilter && card.dataset.currentDomain !== domainFilter) {{
+                if (domainFilter && card.dataset.currentDomain !== domainFilter) {
                     show = false;
-                }}
+                }
                 
-                if (confidenceFilter) {{
+                if (confidenceFilter) {
                     const confidence = parseFloat(card.dataset.confidence);
                     if (confidenceFilter === 'low' && confidence >= 0.5) show = false;
                     if (confidenceFilter === 'medium' && (confidence < 0.5 || confidence >= 0.7)) show = false;
                     if (confidenceFilter === 'high' && confidence < 0.7) show = false;
-                }}
+                }
                 
-                if (searchFilter && !card.dataset.filepath.toLowerCase().includes(searchFilter)) {{
+                if (searchFilter && !card.dataset.filepath.toLowerCase().includes(searchFilter)) {
                     show = false;
-                }}
+                }
                 
                 card.style.display = show ? 'block' : 'none';
-            }});
-        }}
+            });
+        }
+        
+        renderCards(JSON.parse(document.getElementById('review-data').textContent));
         
         // Load previous changes if any
         const savedChanges = localStorage.getItem('mams_review_changes');
-        if (savedChanges) {{
+        if (savedChanges) {
             const saved = JSON.parse(savedChanges);
-            if (confirm('Previous review session found. Load changes?')) {{
+            if (confirm('Previous review session found. Load changes?')) {
                 changes = saved.changes;
                 updateBulkActions();
-            }}
-        }}
+            }
+        }
+""")
+
+_HTML_TEMPLATE_SRC: Final[str] = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>MAMS Frontend Classification Review</title>
+    <style>
+{{ styles }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>MAMS Frontend Classification Review</h1>
+            <p style="color: #718096; margin-top: 10px;">
+                Review and correct low-confidence domain classifications
+            </p>
+        </div>
+        
+        <div class="stats">
+            <div class="stat-card">
+                <div class="stat-value">{{ item_count }}</div>
+                <div class="stat-label">Items to Review</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">{{ low_count }}</div>
+                <div class="stat-label">Low Confidence</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">{{ medium_count }}</div>
+                <div class="stat-label">Medium Confidence</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">{{ validation_report.domain_violations|length }}</div>
+                <div class="stat-label">Domain Violations</div>
+            </div>
+        </div>
+        
+        <div class="filters">
+            <div class="filter-group">
+                <label>Filter by Domain</label>
+                <select id="domainFilter">
+                    <option value="">All Domains</option>
+                    {% for domain in filter_domains %}
+                    <option value="{{ domain }}">{{ domain }}</option>
+                    {% endfor %}
+                </select>
+            </div>
+            <div class="filter-group">
+                <label>Filter by Confidence</label>
+                <select id="confidenceFilter">
+                    <option value="">All</option>
+                    <option value="low">Low (&lt; 0.5)</option>
+                    <option value="medium">Medium (0.5 - 0.7)</option>
+                    <option value="high">High (&gt; 0.7)</option>
+                </select>
+            </div>
+            <div class="filter-group">
+                <label>Search Files</label>
+                <input type="text" id="searchFilter" placeholder="Search file paths...">
+            </div>
+        </div>
+        
+        <div class="review-items" id="reviewItems"></div>
+        <button class="btn btn-secondary" id="loadMore" onclick="loadMore()"
+                style="display: none; margin: 0 auto 30px;">Show next 200</button>
+        
+        <div class="bulk-actions" id="bulkActions">
+            <h3 style="margin-bottom: 15px;">Bulk Actions</h3>
+            <p id="selectedCount">0 items selected</p>
+            <div style="margin-top: 15px;">
+                <button class="btn btn-primary" onclick="applyBulkChanges()">Apply Changes</button>
+                <button class="btn btn-secondary" onclick="clearSelection()">Clear Selection</button>
+            </div>
+        </div>
+    </div>
+    
+    <script type="application/json" id="review-data">{{ payload|tojson }}</script>
+    <script>
+{{ script }}
     </script>
 </body>
 </html>
 """
-        return html
+
+
+def _truncate(value: str, limit: int = 50) -> str:
+    """Cap a string at limit characters, skipping the slice copy for short values"""
+    return value if len(value) <= limit else value[:limit]
+
+
+# Compiled once at import; the card payload goes through |tojson, which escapes it for <script>
+_ENV = jinja2.Environment(
+    loader=jinja2.BaseLoader(),
+    autoescape=jinja2.select_autoescape(default_for_string=True, default=True),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+if ORJSON_AVAILABLE:
+    # orjson output is already compact UTF-8, so it needs no dumps kwargs
+    _ENV.policies['json.dumps_function'] = lambda obj, **kwargs: orjson.dumps(obj).decode('utf-8')
+    _ENV.policies['json.dumps_kwargs'] = {}
+else:
+    _ENV.policies['json.dumps_kwargs'] = {'separators': (',', ':'), 'ensure_ascii': False}
+_ENV.globals['styles'] = Markup(_STYLES)
+_ENV.globals['script'] = Markup(_SCRIPT)
+_TEMPLATE = _ENV.from_string(_HTML_TEMPLATE_SRC)
+
+
+class ReviewUIGenerator:
+    """
+    Generates interactive HTML UI for manual review of classifications
+    """
     
-    def _generate_domain_options(self, review_items: List[Any]) -> str:
-        """Generate domain filter options"""
-        domains = set()
-        for item in review_items:
-            domains.add(item.primary_domain)
-            domains.update(item.secondary_domains)
-        
-        options = []
-        for domain in sorted(domains):
-            options.append(f'<option value="{domain}">{domain}</option>')
+    def __init__(self, compress: bool = True, compress_threshold: int = COMPRESS_THRESHOLD):
+        self.output_dir = Path('/app/.migration/review_ui')
+        self._dir_ready = False
+        self.compress = compress
+        self.compress_threshold = compress_threshold
         
-        return '\n'.join(options)
+    async def generate_review_interface(self, classifications: List[Any], 
+                                       validation_report: Any) -> str:
+        """Generate interactive review UI"""
+        log = debug_log.api
+        log("Generating review UI", level="INFO")
+        
+        # Generate HTML - low-confidence items are filtered in the same pass
+        html_content = self._generate_html(classifications, validation_report)
+        
+        # Save to file - the output directory is created on first use
+        if not self._dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        # Browsers will not render a local .html.gz, so the plain page is always
+        # written and returned; large pages get a gzip copy alongside it
+        output_file = self.output_dir / f'review_{timestamp}.html'
+        await self._write_output(output_file, html_content)
+        if self.compress and len(html_content) >= self.compress_threshold:
+            gz_file = self.output_dir / f'review_{timestamp}.html.gz'
+            await asyncio.to_thread(self._write_compressed, gz_file, html_content)
+        
+        log(f"Review UI generated: {output_file}", level="INFO")
+        return str(output_file)
+    
+    async def _write_output(self, output_file: Path, html_content: str):
+        """Write the review UI without blocking the event loop"""
+        # Encode once and hand the kernel a single write
+        data = html_content.encode('utf-8')
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(output_file, 'wb') as f:
+                await f.write(data)
+        else:
+            await asyncio.to_thread(output_file.write_bytes, data)
     
-    def _generate_review_cards(self, review_items: List[Any]) -> str:
-        """Generate individual review cards"""
+    def _write_compressed(self, output_file: Path, html_content: str):
+        """Write a gzip copy of the review UI - card markup is highly repetitive"""
+        data = html_content.encode('utf-8')
+        with gzip.open(output_file, 'wb', compresslevel=6) as f:
+            f.write(data)
+        
+        compressed_size = output_file.stat().st_size
+        debug_log.api(
+            f"Compressed review UI {len(data)} -> {compressed_size} bytes "
+            f"({len(data) / max(compressed_size, 1):.1f}x)",
+            level="INFO"
+        )
+    
+    def _generate_html(self, classifications: List[Any], validation_report: Any) -> str:
+        """Generate HTML content for review UI"""
+        # One pass filters the review items and builds the filter domains,
+        # the confidence stat counts and the card payload
+        domains = set()
+        low_count = medium_count = 0
         cards = []
-        
-        for i, item in enumerate(review_items):
-            card_id = f"card_{i}"
-            
-            # Determine confidence level
-            if item.confidence < 0.5:
-                confidence_class = 'confidence-low'
-            elif item.confidence < 0.7:
-                confidence_class = 'confidence-medium'
-            else:
-                confidence_class = 'confidence-high'
+        for item in classifications:
+            if not item.requires_review:
+                continue
             
-            # Get top evidence
-            top_evidence = []
-            for ev in item.evidence[:5]:
-                top_evidence.append(f"""
-                    <div class="evidence-item">
-                        <span class="evidence-type">{ev.type}</span>
-                        <span class="evidence-value">{ev.value[:50]}</span>
-                    </div>
-                """)
+            domains.add(item.primary_domain)
+            domains.update(item.secondary_domains)
             
-            # Get domain options
-            all_domains = ['auth', 'ai', 'brand', 'content', 'messaging', 'analytics', 
-                          'business', 'storage', 'workflow', 'ui', 'shared', 'platform']
+            confidence = item.confidence
+            if confidence < 0.5:
+                low_count += 1
+            elif confidence < 0.7:
+                medium_count += 1
             
-            domain_buttons = []
-            for domain in all_domains:
-                is_current = domain == item.primary_domain
-                is_secondary = domain in item.secondary_domains
-                
-                class_name = 'domain-option'
-                if is_current:
-                    class_name += ' current'
-                elif is_secondary:
-                    class_name += ' secondary'
-                
-                domain_buttons.append(f"""
-                    <div class="{class_name}" 
-                         data-domain="{domain}"
-                         onclick="selectDomain('{card_id}', '{domain}')">
-                        {domain}
-                    </div>
-                """)
-            
-            # Generate card HTML
-            card = f"""
-            <div class="review-card" id="{card_id}" 
-                 data-filepath="{item.file_path}"
-                 data-current-domain="{item.primary_domain}"
-                 data-confidence="{item.confidence}">
-                <div class="review-header">
-                    <div class="file-path">{Path(item.file_path).name}</div>
-                    <div class="confidence-badge {confidence_class}">
-                        {item.confidence:.2f}
-                    </div>
-                </div>
-                
-                <div class="review-body">
-                    {'<div class="review-reasons">' + 
-                     ''.join([f'<div class="review-reason">• {r}</div>' for r in item.review_reasons]) + 
-                     '</div>' if item.review_reasons else ''}
-                    
-                    <div class="domain-section">
-                        <div class="domain-label">Current: {item.primary_domain}</div>
-                        <div class="domain-options">
-                            {''.join(domain_buttons)}
-                        </div>
-                    </div>
-                    
-                    <div class="evidence-section">
-                        <div class="evidence-title">Evidence</div>
-                        {''.join(top_evidence)}
-                    </div>
-                    
-                    {f'<div class="dependencies-list">' +
-                     '<div class="evidence-title">Dependencies</div>' +
-                     ''.join([f'<div class="dependency-item">• {d}</div>' 
-                             for d in list(item.dependencies)[:5]]) +
-                     '</div>' if item.dependencies else ''}
-                </div>
-                
-                <div class="review-actions">
-                    <button class="btn btn-primary" onclick="approveClassification('{card_id}')">
-                        Approve
-                    </button>
-                    <button class="btn btn-secondary" onclick="skipClassification('{card_id}')">
-                        Skip
-                    </button>
-                    <button class="btn btn-danger" onclick="flagForManual('{card_id}')">
-                        Flag
-                    </button>
-                </div>
-            </div>
-            """
-            
-            cards.append(card)
-        
-        return '\n'.join(cards)
+            cards.append({
+                'id': len(cards),
+                'file_path': item.file_path,
+                'primary_domain': item.primary_domain,
+                'secondary_domains': list(item.secondary_domains),
+                'confidence': confidence,
+                'review_reasons': list(item.review_reasons),
+                'evidence': [{'type': ev.type, 'value': _truncate(ev.value)} for ev in item.evidence[:5]],
+                'dependencies': list(islice(item.dependencies, 5))
+            })
+        
+        # Stream the template's output chunks straight into a single buffer
+        buf = io.StringIO()
+        buf.writelines(_TEMPLATE.generate(
+            item_count=len(cards),
+            payload={'all_domains': ALL_DOMAINS, 'items': cards},
+            validation_report=validation_report,
+            low_count=low_count,
+            medium_count=medium_count,
+            filter_domains=sorted(domains)
+        ))
+        return buf.getvalue()
 
 
 if __name__ == "__main__":
-    import asyncio
+    @dataclass(slots=True)
+    class MockEvidence:
+        type: str
+        value: str
+    
+    @dataclass(slots=True)
+    class MockClassification:
+        file_path: str
+        primary_domain: str
+        secondary_domains: List[str]
+        confidence: float
+        requires_review: bool
+        review_reasons: List[str]
+        evidence: List[MockEvidence]
+        dependencies: List[str]
+    
+    @dataclass(slots=True)
+    class MockValidationReport:
+        is_valid: bool
+        domain_violations: List[Any]
     
     async def test_generator():
         generator = ReviewUIGenerator()
         
         # Create mock data
         mock_classifications = [
-            type('Classification', (), {
-                'file_path': '/app/client/src/components/auth/Login.tsx',
-                'primary_domain': 'auth',
-                'secondary_domains': ['ui'],
-                'confidence': 0.45,
-                'requires_review': True,
-                'review_reasons': ['Low confidence score', 'Multiple domain indicators'],
-                'evidence': [
-                    type('Evidence', (), {
-                        'type': 'import',
-                        'value': 'Imports @/services/auth'
-                    })(),
-                    type('Evidence', (), {
-                        'type': 'component',
-                        'value': 'Component name: LoginForm'
-                    })()
+            MockClassification(
+                file_path='/app/client/src/components/auth/Login.tsx',
+                primary_domain='auth',
+                secondary_domains=['ui'],
+                confidence=0.45,
+                requires_review=True,
+                review_reasons=['Low confidence score', 'Multiple domain indicators'],
+                evidence=[
+                    MockEvidence(type='import', value='Imports @/services/auth'),
+                    MockEvidence(type='component', value='Component name: LoginForm')
                 ],
-                'dependencies': ['@/services/auth', '@/components/ui/Button']
-            })()
+                dependencies=['@/services/auth', '@/components/ui/Button']
+            )
         ]
         
-        mock_validation = type('ValidationReport', (), {
-            'is_valid': True,
-            'domain_violations': []
-        })()
+        mock_validation = MockValidationReport(is_valid=True, domain_violations=[])
         
         # Generate UI
         ui_path = await generator.generate_review_interface(
@@ -5,19 +5,15 @@ Handles multiple discovery runs and resolves conflicts intelligently
 """
 
 import os
-import sys
 import json
+import argparse
 import hashlib
+import functools
 import asyncio
 import asyncpg
-from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
-# Add parent paths for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 try:
     from arkyvus.services.unified_logger import UnifiedLogger
     logger = UnifiedLogger.getLogger(__name__)
@@ -26,14 +22,219 @@ except ImportError:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Runs with more signature comparisons than this are scored with NumPy
+NUMPY_SIMILARITY_THRESHOLD = 1_000
+
+# Item attributes that identify a discovery run
+FINGERPRINT_FIELDS = ('full_qualified_name', 'source_type', 'service_name', 'method_name')
+
+# Number of signature features compared - the maximum Manhattan distance per feature is 1
+SIGNATURE_FEATURES = 3
+
+@functools.lru_cache(maxsize=40000)
+def _item_hash(*fields: str) -> bytes:
+    """Digest one item's fingerprint fields - memoized since runs share most items"""
+    digest = hashlib.sha256()
+    for value in fields:
+        digest.update(value.encode())
+        digest.update(b'\x1f')
+    return digest.digest()
+
+def _signature_key(sig: Dict) -> Tuple[str, int, str]:
+    """Reduce a method signature to the parts similarity is computed from"""
+    return_type = sig.get('return_type', '')
+    # Keys feed the memoized similarity, so structured return types (dicts, lists)
+    # are reduced to canonical JSON text to keep them hashable
+    if not isinstance(return_type, str):
+        return_type = json.dumps(return_type, sort_keys=True, default=str)
+    return (
+        sig.get('method_name', ''),
+        len(sig.get('parameters', [])),
+        return_type
+    )
+
+@functools.lru_cache(maxsize=40000)
+def _signature_similarity(key1: Tuple[str, int, str], key2: Tuple[str, int, str]) -> float:
+    """Similarity between two signature keys - memoized since most signatures recur"""
+    name1, param_count1, return1 = key1
+    name2, param_count2, return2 = key2
+    
+    # Manhattan distance over the normalized mismatch vector
+    # (method name, relative parameter-count change, return type at half weight)
+    distance = (
+        (0.0 if name1 == name2 else 1.0)
+        + abs(param_count1 - param_count2) / max(param_count1, param_count2, 1)
+        + (0.0 if return1 == return2 else 0.5)
+    )
+    return 1.0 - distance / SIGNATURE_FEATURES
+
+# Hot lookups - constant text so the per-connection statement cache (see get_pool)
+# prepares each one once and reuses the plan on every later call
+PREVIOUS_RUN_SQL = '''
+    SELECT id, start_time, execution_results
+    FROM mams_execution_log 
+    WHERE mams_component = $1 
+        AND source_fingerprint = $2
+        AND status = 'completed'
+    ORDER BY start_time DESC 
+    LIMIT 1
+'''
+
+# One row per incoming FQN, in input order; id is NULL for items not yet catalogued
+EXISTING_ITEMS_SQL = '''
+    WITH incoming AS (
+        SELECT fqn, ord FROM unnest($1::text[]) WITH ORDINALITY AS t(fqn, ord)
+    )
+    SELECT m.id, m.method_signature, m.hours_old, m.hours_old > $2 AS needs_update
+    FROM incoming i
+    LEFT JOIN LATERAL (
+        SELECT id, method_signature,
+               (EXTRACT(EPOCH FROM ((now() AT TIME ZONE 'UTC') - created_at)) / 3600)::float8 AS hours_old
+        FROM migration_source_catalog 
+        WHERE full_qualified_name = i.fqn
+        ORDER BY created_at DESC
+        LIMIT 1
+    ) m ON TRUE
+    ORDER BY i.ord
+'''
+
+# Indexes that turn both hot lookups into single btree descents. idx_msc_fqn also
+# orders by created_at so the newest row per FQN is read straight off the index;
+# it is not UNIQUE because nothing prevents duplicate FQNs in the catalog today,
+# and a unique build would fail on that existing data
+LOOKUP_INDEX_SQL = {
+    'idx_mams_exec_lookup': '''CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mams_exec_lookup
+       ON mams_execution_log (mams_component, source_fingerprint, status, start_time DESC)''',
+    'idx_msc_fqn': '''CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_msc_fqn
+       ON migration_source_catalog (full_qualified_name, created_at DESC)'''
+}
+
+# NULL when the index does not exist, otherwise whether it finished building
+INDEX_VALID_SQL = '''
+    SELECT i.indisvalid
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relname = $1 AND pg_catalog.pg_table_is_visible(c.oid)
+'''
+
+# jsonb values are bound as JSON text and cast in SQL, so inserts work on any
+# connection - pooled ones with the json codecs and plain asyncpg.connect() alike
+INSERT_CATALOG_ITEM_SQL = '''
+    INSERT INTO migration_source_catalog 
+    (source_type, full_qualified_name, service_name, method_name, 
+     method_signature, current_state, discovery_metadata)
+    VALUES ($1, $2, $3, $4, $5::text::jsonb, $6, $7::text::jsonb)
+'''
+
+UPDATE_CATALOG_ITEM_SQL = '''
+    UPDATE migration_source_catalog 
+    SET last_seen = CURRENT_TIMESTAMP,
+        discovery_metadata = jsonb_set(
+            discovery_metadata, 
+            '{last_dedup_update}', 
+            to_jsonb(CURRENT_TIMESTAMP::text)
+        )
+    WHERE id = $1
+'''
+
+# Process-wide pool shared by every engine instance
+_pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+
+def _json_encode(value: Any) -> str:
+    """Encode a json/jsonb parameter, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value)
+
+async def _init_connection(conn):
+    """Decode json/jsonb columns to Python objects on every new pooled connection"""
+    decoder = orjson.loads if ORJSON_AVAILABLE else json.loads
+    for type_name in ('json', 'jsonb'):
+        await conn.set_type_codec(
+            type_name, encoder=_json_encode, decoder=decoder, schema='pg_catalog', format='text'
+        )
+
+async def get_pool(dsn: Optional[str] = None, statement_cache_size: int = 100) -> asyncpg.Pool:
+    """
+    Get the shared connection pool, creating it on first use
+    
+    The DSN comes from ARKYVUS_DSN unless given; DB_POOL_MIN and DB_POOL_MAX
+    size the pool for the environment.
+    
+    Every SQL constant in this module is prepared once per connection by
+    asyncpg's statement cache and reused on later calls. Behind a
+    transaction-mode pooler (pgbouncer, Neon) pass statement_cache_size=0:
+    server-side statements do not survive connection hand-off there, so
+    each call is parsed and planned again.
+    """
+    global _pool
+    async with _pool_lock:
+        if _pool is None:
+            dsn = dsn or os.environ.get('ARKYVUS_DSN')
+            if not dsn:
+                raise RuntimeError("ARKYVUS_DSN is not set - cannot connect to the arkyvus database")
+            
+            _pool = await asyncpg.create_pool(
+                dsn,
+                min_size=int(os.getenv('DB_POOL_MIN', '10')),
+                max_size=int(os.getenv('DB_POOL_MAX', '50')),
+                command_timeout=60,
+                max_queries=50000,
+                max_inactive_connection_lifetime=300,
+                statement_cache_size=statement_cache_size,
+                init=_init_connection
+            )
+    return _pool
+
+async def close_pool():
+    """Close the shared connection pool - the next get_pool call creates a fresh one"""
+    global _pool
+    async with _pool_lock:
+        if _pool is not None:
+            await _pool.close()
+            _pool = None
+
+async def ensure_lookup_indexes(pool: asyncpg.Pool):
+    """
+    Create the lookup indexes if missing - a one-time admin step, run with
+    `python mams_deduplication_engine.py --create-indexes` by a table owner
+    
+    Builds run CONCURRENTLY, so they are safe on a live catalog. A failed
+    concurrent build leaves an INVALID index that IF NOT EXISTS would skip,
+    so invalid indexes are dropped and rebuilt.
+    """
+    async with pool.acquire() as conn:
+        for name, statement in LOOKUP_INDEX_SQL.items():
+            valid = await conn.fetchval(INDEX_VALID_SQL, name)
+            if valid:
+                continue
+            if valid is False:
+                logger.warning(f"Rebuilding invalid index {name}")
+                await conn.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+            logger.info(f"Creating index {name}")
+            await conn.execute(statement)
+
+@dataclass(slots=True, frozen=True)
 class DeduplicationResult:
     """Result of deduplication analysis"""
     action: str  # 'skip', 'update', 'create', 'conflict'
     reason: str
     existing_id: Optional[str] = None
     confidence: float = 0.0
-    metadata: Dict[str, Any] = None
+    metadata: Optional[Dict[str, Any]] = None
 
 class MAMSDeduplicationEngine:
     """
@@ -41,7 +242,8 @@ class MAMSDeduplicationEngine:
     Handles multiple discovery runs and resolves conflicts
     """
     
-    def __init__(self):
+    def __init__(self, pool: Optional[asyncpg.Pool] = None):
+        self.pool = pool
         self.fingerprint_cache = {}
         self.conflict_rules = self._load_conflict_resolution_rules()
         
@@ -70,83 +272,94 @@ class MAMSDeduplicationEngine:
         """
         logger.info(f"🔍 Analyzing discovery run for {mams_component}")
         
-        conn = await asyncpg.connect("postgresql://admin:chooters@db:5432/arkyvus_db")
-        try:
-            # Generate fingerprint for this discovery run
-            run_fingerprint = self._generate_run_fingerprint(discovered_items)
-            
-            # Check if identical run already exists
-            previous_run = await self._check_previous_run(conn, mams_component, run_fingerprint)
-            
-            if previous_run:
-                return {
-                    'action': 'skip_identical',
-                    'reason': f'Identical run detected from {previous_run["start_time"]}',
-                    'previous_execution_id': previous_run['id'],
-                    'items_analyzed': len(discovered_items),
-                    'deduplication_actions': []
-                }
-            
-            # Analyze each discovered item
-            dedup_actions = []
-            stats = {
-                'create': 0,
-                'update': 0, 
-                'skip': 0,
-                'conflict': 0
-            }
-            
-            for item in discovered_items:
-                result = await self._analyze_item(conn, item)
-                dedup_actions.append({
-                    'item': item,
-                    'result': result
-                })
-                stats[result.action] += 1
-            
+        if self.pool is None:
+            self.pool = await get_pool()
+        
+        # Generate fingerprint for this discovery run
+        run_fingerprint = self._generate_run_fingerprint(discovered_items)
+        
+        # Check for an identical previous run and fetch every already-catalogued
+        # item concurrently, each on its own pooled connection; if either fails
+        # the other is cancelled and its connection released back to the pool
+        async with asyncio.TaskGroup() as tg:
+            previous_task = tg.create_task(
+                self._with_connection(self._check_previous_run, mams_component, run_fingerprint)
+            )
+            existing_task = tg.create_task(
+                self._with_connection(self._fetch_existing_items, discovered_items)
+            )
+        previous_run = previous_task.result()
+        existing_rows = existing_task.result()
+        
+        if previous_run:
             return {
-                'action': 'process',
-                'run_fingerprint': run_fingerprint,
+                'action': 'skip_identical',
+                'reason': f'Identical run detected from {previous_run["start_time"]}',
+                'previous_execution_id': previous_run['id'],
                 'items_analyzed': len(discovered_items),
-                'statistics': stats,
-                'deduplication_actions': dedup_actions,
-                'conflicts_requiring_resolution': [
-                    action for action in dedup_actions 
-                    if action['result'].action == 'conflict'
-                ]
+                'deduplication_actions': []
             }
-            
-        finally:
-            await conn.close()
+        
+        # Analyze each discovered item
+        dedup_actions = []
+        stats = {
+            'create': 0,
+            'update': 0, 
+            'skip': 0,
+            'conflict': 0
+        }
+        
+        # Score every signature change in one batch
+        similarities = iter(self._batch_signature_similarity([
+            (existing['method_signature'] or {}, item.get('method_signature', {}) or {})
+            for item, existing in zip(discovered_items, existing_rows) if existing
+        ]))
+        
+        for item, existing in zip(discovered_items, existing_rows):
+            result = self._analyze_item(item, existing, next(similarities) if existing else None)
+            dedup_actions.append({
+                'item': item,
+                'result': result
+            })
+            stats[result.action] += 1
+        
+        return {
+            'action': 'process',
+            'run_fingerprint': run_fingerprint,
+            'items_analyzed': len(discovered_items),
+            'statistics': stats,
+            'deduplication_actions': dedup_actions,
+            'conflicts_requiring_resolution': [
+                action for action in dedup_actions 
+                if action['result'].action == 'conflict'
+            ]
+        }
+    
+    async def _with_connection(self, query, *args):
+        """Run a query coroutine on its own connection from the pool"""
+        async with self.pool.acquire() as conn:
+            return await query(conn, *args)
     
-    async def _check_previous_run(self, conn, mams_component: str, fingerprint: str) -> Optional[Dict]:
+    async def _check_previous_run(self, conn, mams_component: str, fingerprint: str) -> Optional[asyncpg.Record]:
         """Check if identical run already exists"""
-        result = await conn.fetchrow("""
-            SELECT id, start_time, execution_results
-            FROM mams_execution_log 
-            WHERE mams_component = $1 
-                AND source_fingerprint = $2
-                AND status = 'completed'
-            ORDER BY start_time DESC 
-            LIMIT 1
-        """, mams_component, fingerprint)
+        # Always ask the database - runs completed by other processes must be seen,
+        # and idx_mams_exec_lookup makes this a single index descent
+        return await conn.fetchrow(PREVIOUS_RUN_SQL, mams_component, fingerprint)
+    
+    async def _fetch_existing_items(self, conn, discovered_items: List[Dict[str, Any]]) -> List[Optional[asyncpg.Record]]:
+        """Look up all discovered items in the catalog with a single query, aligned to the input"""
+        fqns = [item.get('full_qualified_name', '') for item in discovered_items]
+        rows = await conn.fetch(
+            EXISTING_ITEMS_SQL, fqns, float(self.conflict_rules['update_threshold_hours'])
+        )
         
-        return dict(result) if result else None
+        return [row if row['id'] is not None else None for row in rows]
     
-    async def _analyze_item(self, conn, item: Dict[str, Any]) -> DeduplicationResult:
-        """Analyze individual discovered item for deduplication"""
-        full_qualified_name = item.get('full_qualified_name', '')
-        service_name = item.get('service_name', '')
+    def _analyze_item(self, item: Dict[str, Any], existing: Optional[asyncpg.Record],
+                      similarity: Optional[float] = None) -> DeduplicationResult:
+        """Analyze individual discovered item against its existing catalog row"""
         method_signature = item.get('method_signature', {})
         
-        # Check if item already exists
-        existing = await conn.fetchrow("""
-            SELECT id, full_qualified_name, method_signature, last_seen, 
-                   discovery_metadata, created_at
-            FROM migration_source_catalog 
-            WHERE full_qualified_name = $1
-        """, full_qualified_name)
-        
         if not existing:
             return DeduplicationResult(
                 action='create',
@@ -158,15 +371,16 @@ class MAMSDeduplicationEngine:
         existing_sig = existing['method_signature'] or {}
         current_sig = method_signature or {}
         
-        # Calculate signature similarity
-        similarity = self._calculate_signature_similarity(existing_sig, current_sig)
+        # Calculate signature similarity unless the batch already scored it
+        if similarity is None:
+            similarity = self._calculate_signature_similarity(existing_sig, current_sig)
         
-        # Check age of existing item
-        hours_old = (datetime.utcnow() - existing['created_at']).total_seconds() / 3600
+        # Age of existing item, computed by the catalog query
+        hours_old = existing['hours_old']
         
         # Decision logic
         if similarity > (1 - self.conflict_rules['signature_change_tolerance']):
-            if hours_old > self.conflict_rules['update_threshold_hours']:
+            if existing['needs_update']:
                 return DeduplicationResult(
                     action='update',
                     reason=f'Item exists but is {hours_old:.1f}h old, updating last_seen',
@@ -186,11 +400,8 @@ class MAMSDeduplicationEngine:
                 reason=f'Signature change detected (similarity: {similarity:.2f})',
                 existing_id=str(existing['id']),
                 confidence=similarity,
-                metadata={
-                    'existing_signature': existing_sig,
-                    'new_signature': current_sig,
-                    'similarity_score': similarity
-                }
+                # Signatures stay in the catalog row and the discovered item
+                metadata={'similarity_score': similarity}
             )
     
     def _calculate_signature_similarity(self, sig1: Dict, sig2: Dict) -> float:
@@ -200,50 +411,60 @@ class MAMSDeduplicationEngine:
         if not sig1 or not sig2:
             return 0.0
         
-        # Compare key signature elements
-        similarity_factors = []
+        # A renamed method is always a conflict - skip the parameter and return comparison
+        if sig1.get('method_name', '') != sig2.get('method_name', ''):
+            return 0.0
         
-        # Compare method names
-        name1 = sig1.get('method_name', '')
-        name2 = sig2.get('method_name', '')
-        similarity_factors.append(1.0 if name1 == name2 else 0.0)
+        return _signature_similarity(_signature_key(sig1), _signature_key(sig2))
+    
+    def _batch_signature_similarity(self, pairs: List[Tuple[Dict, Dict]]) -> List[float]:
+        """Calculate similarity for every (existing, new) signature pair"""
+        count = len(pairs)
+        if not NUMPY_AVAILABLE or count <= NUMPY_SIMILARITY_THRESHOLD:
+            return [self._calculate_signature_similarity(old, new) for old, new in pairs]
         
-        # Compare parameter counts
-        params1 = sig1.get('parameters', [])
-        params2 = sig2.get('parameters', [])
-        if len(params1) == len(params2):
-            similarity_factors.append(1.0)
-        else:
-            max_params = max(len(params1), len(params2))
-            if max_params > 0:
-                similarity_factors.append(1.0 - abs(len(params1) - len(params2)) / max_params)
-            else:
-                similarity_factors.append(1.0)
+        old_keys = [_signature_key(old) if old else ('', 0, '') for old, _ in pairs]
+        new_keys = [_signature_key(new) if new else ('', 0, '') for _, new in pairs]
+        
+        old_plen = np.fromiter((key[1] for key in old_keys), dtype=np.int32, count=count)
+        new_plen = np.fromiter((key[1] for key in new_keys), dtype=np.int32, count=count)
+        
+        name_mismatch = (np.array([key[0] for key in old_keys], dtype=object)
+                         != np.array([key[0] for key in new_keys], dtype=object))
         
-        # Compare return types
-        return1 = sig1.get('return_type', '')
-        return2 = sig2.get('return_type', '')
-        similarity_factors.append(1.0 if return1 == return2 else 0.5)
+        # Normalized mismatch vectors, one row per pair, reduced with a single L1 sum
+        mismatch = np.column_stack((
+            name_mismatch,
+            np.abs(old_plen - new_plen) / np.maximum(np.maximum(old_plen, new_plen), 1),
+            np.where(np.array([key[2] for key in old_keys], dtype=object)
+                     != np.array([key[2] for key in new_keys], dtype=object), 0.5, 0.0)
+        )).astype(np.float64)
+        similarity = np.where(name_mismatch, 0.0, 1.0 - mismatch.sum(axis=1) / SIGNATURE_FEATURES)
         
-        return sum(similarity_factors) / len(similarity_factors)
+        # Missing signatures: both empty is identical, one empty is a full change
+        old_empty = np.fromiter((not old for old, _ in pairs), dtype=bool, count=count)
+        new_empty = np.fromiter((not new for _, new in pairs), dtype=bool, count=count)
+        similarity = np.where(old_empty & new_empty, 1.0,
+                              np.where(old_empty | new_empty, 0.0, similarity))
+        return similarity.tolist()
     
     def _generate_run_fingerprint(self, discovered_items: List[Dict[str, Any]]) -> str:
         """Generate fingerprint for discovery run to detect identical runs"""
-        # Sort items by qualified name for consistent hashing
-        sorted_items = sorted(discovered_items, key=lambda x: x.get('full_qualified_name', ''))
+        # Key each item once with its qualified name and memoized digest, then sort
+        # the (fqn, digest) tuples natively - no per-comparison key callback
+        keyed = [
+            (str(item.get('full_qualified_name') or ''),
+             _item_hash(*(str(item.get(key) or '') for key in FINGERPRINT_FIELDS)))
+            for item in discovered_items
+        ]
+        keyed.sort()
         
-        # Create fingerprint from key item attributes
-        fingerprint_data = []
-        for item in sorted_items:
-            fingerprint_data.append({
-                'fqn': item.get('full_qualified_name', ''),
-                'type': item.get('source_type', ''),
-                'service': item.get('service_name', ''),
-                'method': item.get('method_name', '')
-            })
+        # Fold the fixed-size per-item digests into the run hash
+        digest = hashlib.sha256()
+        for _, item_digest in keyed:
+            digest.update(item_digest)
         
-        fingerprint_json = json.dumps(fingerprint_data, sort_keys=True)
-        return hashlib.sha256(fingerprint_json.encode()).hexdigest()
+        return digest.hexdigest()
     
     async def execute_deduplication_actions(self, 
                                           conn,
@@ -258,70 +479,83 @@ class MAMSDeduplicationEngine:
             'errors': []
         }
         
+        # Partition the actions by a single dict lookup so each kind is handled as a batch
+        by_action = {'create': [], 'update': [], 'skip': [], 'conflict': []}
         for action_item in dedup_analysis.get('deduplication_actions', []):
-            item = action_item['item']
-            result = action_item['result']
+            by_action[action_item['result'].action].append(action_item)
+        
+        creates = [(a['item'], self._create_record(a['item'], execution_id)) for a in by_action['create']]
+        updates = [(a['item'], (self._catalog_id(a['result'].existing_id),)) for a in by_action['update']]
+        results['skipped'] = len(by_action['skip'])
+        
+        for action_item in by_action['conflict']:
+            await self._log_conflict(conn, action_item['item'], action_item['result'], execution_id)
+        results['conflicts_logged'] = len(by_action['conflict'])
+        
+        try:
+            async with conn.transaction():
+                if creates:
+                    await conn.executemany(INSERT_CATALOG_ITEM_SQL, [args for _, args in creates])
+                if updates:
+                    await conn.executemany(UPDATE_CATALOG_ITEM_SQL, [args for _, args in updates])
+            results['created'] = len(creates)
+            results['updated'] = len(updates)
             
+        except Exception as e:
+            # The batch was rolled back - store row by row so one bad item
+            # does not drop the rest, and report each failure by name
+            logger.warning(f"Batch store failed ({e}), retrying {len(creates) + len(updates)} items individually")
+            results['created'] = await self._execute_rows(conn, INSERT_CATALOG_ITEM_SQL, creates, results['errors'])
+            results['updated'] = await self._execute_rows(conn, UPDATE_CATALOG_ITEM_SQL, updates, results['errors'])
+        
+        return results
+    
+    async def _execute_rows(self, conn, sql: str, rows: List[Tuple[Dict[str, Any], Tuple]],
+                            errors: List[str]) -> int:
+        """Execute one statement per row, each in its own transaction; returns rows stored"""
+        stored = 0
+        for item, args in rows:
             try:
-                if result.action == 'create':
-                    await self._create_item(conn, item, execution_id)
-                    results['created'] += 1
-                    
-                elif result.action == 'update':
-                    await self._update_item(conn, item, result.existing_id)
-                    results['updated'] += 1
-                    
-                elif result.action == 'skip':
-                    results['skipped'] += 1
-                    
-                elif result.action == 'conflict':
-                    await self._log_conflict(conn, item, result, execution_id)
-                    results['conflicts_logged'] += 1
-                    
+                async with conn.transaction():
+                    await conn.execute(sql, *args)
+                stored += 1
             except Exception as e:
                 error_msg = f"Error processing {item.get('full_qualified_name', 'unknown')}: {str(e)}"
-                results['errors'].append(error_msg)
+                errors.append(error_msg)
                 logger.error(error_msg)
-        
-        return results
+        return stored
     
-    async def _create_item(self, conn, item: Dict[str, Any], execution_id: str):
-        """Create new item in migration_source_catalog"""
-        await conn.execute('''
-            INSERT INTO migration_source_catalog 
-            (source_type, full_qualified_name, service_name, method_name, 
-             method_signature, current_state, discovery_metadata)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-        ''',
-        item.get('source_type'),
-        item.get('full_qualified_name'),
-        item.get('service_name'),
-        item.get('method_name'),
-        json.dumps(item.get('method_signature', {})),
-        item.get('current_state', 'discovered'),
-        json.dumps({
-            **item.get('discovery_metadata', {}),
-            'mams_execution_id': execution_id,
-            'deduplication_action': 'create'
-        }))
+    @staticmethod
+    def _catalog_id(existing_id: Optional[str]) -> Any:
+        """Restore a catalog id to its column type - results carry it as text"""
+        if existing_id is not None and existing_id.isdigit():
+            return int(existing_id)
+        return existing_id
     
-    async def _update_item(self, conn, item: Dict[str, Any], existing_id: str):
-        """Update existing item's last_seen timestamp"""
-        await conn.execute('''
-            UPDATE migration_source_catalog 
-            SET last_seen = CURRENT_TIMESTAMP,
-                discovery_metadata = jsonb_set(
-                    discovery_metadata, 
-                    '{last_dedup_update}', 
-                    to_jsonb(CURRENT_TIMESTAMP::text)
-                )
-            WHERE id = $1
-        ''', existing_id)
+    def _create_record(self, item: Dict[str, Any], execution_id: str) -> Tuple:
+        """Build the migration_source_catalog insert parameters for a new item"""
+        return (
+            item.get('source_type'),
+            item.get('full_qualified_name'),
+            item.get('service_name'),
+            item.get('method_name'),
+            _json_encode(item.get('method_signature', {})),
+            item.get('current_state', 'discovered'),
+            _json_encode({
+                **item.get('discovery_metadata', {}),
+                'mams_execution_id': execution_id,
+                'deduplication_action': 'create'
+            })
+        )
     
     async def _log_conflict(self, conn, item: Dict[str, Any], result: DeduplicationResult, execution_id: str):
         """Log conflict for manual resolution"""
-        # This would insert into a conflicts table for manual review
-        logger.warning(f"⚠️ Conflict detected: {item.get('full_qualified_name')} - {result.reason}")
+        # This would insert into a conflicts table for manual review; the existing
+        # signature is read from the catalog row by id when the conflict is reviewed
+        logger.warning(
+            f"⚠️ Conflict detected: {item.get('full_qualified_name')} "
+            f"(catalog id {result.existing_id}) - {result.reason}"
+        )
 
 async def main():
     """Test the deduplication engine"""
@@ -339,8 +573,23 @@ async def main():
         }
     ]
     
-    analysis = await engine.analyze_discovery_run('MAMS-002', test_items, 'backend')
-    print(f"Deduplication Analysis: {json.dumps(analysis, indent=2, default=str)}")
+    try:
+        analysis = await engine.analyze_discovery_run('MAMS-002', test_items, 'backend')
+        print(f"Deduplication Analysis: {json.dumps(analysis, indent=2, default=str)}")
+    finally:
+        await close_pool()
+
+async def create_indexes():
+    """Create the lookup indexes on the configured database"""
+    try:
+        await ensure_lookup_indexes(await get_pool())
+    finally:
+        await close_pool()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--create-indexes', action='store_true',
+                        help='Create the deduplication lookup indexes (needs table ownership)')
+    args = parser.parse_args()
+    
+    asyncio.run(create_indexes() if args.create_indexes else main())
\ No newline at end of file
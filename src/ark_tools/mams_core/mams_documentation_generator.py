@@ -5,12 +5,149 @@ Generates comprehensive documentation from migration JSON outputs.
 Robustly handles missing data by cross-referencing multiple JSON sources.
 """
 
+import io
 import json
 import os
+import re
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
-from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+from collections import Counter, defaultdict
+from functools import cached_property, lru_cache
+from operator import itemgetter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Master mapping locations in precedence order; MAMS_MASTER_MAPPING_PATH, when
+# set, is tried before these
+_MASTER_MAPPING_CANDIDATES = (
+    '/app/MAMS_MASTER_MAPPING.json',
+    './MAMS_MASTER_MAPPING.json',
+    '../MAMS_MASTER_MAPPING.json',
+    '/Users/pregenie/Development/arkyvus_project/MAMS_MASTER_MAPPING.json',
+)
+
+# Extensions that mark a file as frontend source
+_FRONTEND_EXTS = ('.tsx', '.ts', '.jsx', '.js')
+
+# Fallback hints for component files that matched no domain pattern
+_COMPONENT_EXTS = ('.tsx', '.jsx')
+_UI_HINTS = ('component', 'view')
+_SHARED_HINTS = ('util', 'helper', 'hook')
+
+# Service fields the report reads; everything else in an extraction entry is dropped
+_SERVICE_FIELDS = ('platform', 'file', 'domain', 'file_type', 'target', 'service')
+
+# Folder/name patterns per domain, in match priority order
+_DOMAIN_FOLDERS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('auth', ('auth', 'authentication', 'login', 'signup', 'session')),
+    ('user', ('user', 'users', 'profile', 'account', 'settings')),
+    ('dashboard', ('dashboard', 'home', 'overview', 'analytics')),
+    ('admin', ('admin', 'administration', 'management', 'superuser')),
+    ('api', ('api', 'services', 'endpoints', 'client')),
+    ('content', ('content', 'articles', 'posts', 'blog', 'media')),
+    ('commerce', ('commerce', 'shop', 'cart', 'checkout', 'payment', 'order')),
+    ('messaging', ('message', 'messaging', 'chat', 'notification', 'email')),
+    ('search', ('search', 'filter', 'query', 'find')),
+    ('report', ('report', 'reports', 'analytics', 'metrics', 'statistics')),
+    ('security', ('security', 'permission', 'role', 'access', 'guard')),
+    ('workflow', ('workflow', 'process', 'task', 'job', 'queue')),
+    ('integration', ('integration', 'webhook', 'sync', 'import', 'export')),
+    ('ui', ('components', 'ui', 'ux', 'design', 'layout', 'theme')),
+    ('shared', ('shared', 'common', 'utils', 'helpers', 'lib')),
+    ('test', ('test', 'tests', 'spec', 'testing', '__test__', '__tests__')),
+)
+
+
+def _ordered_domain_patterns() -> List[tuple]:
+    """
+    Flatten _DOMAIN_FOLDERS into (pattern, domain) pairs in priority order.
+    Duplicates and patterns containing an earlier pattern can never win a
+    match, so they are dropped.
+    """
+    ordered = []
+    for domain, patterns in _DOMAIN_FOLDERS:
+        for pattern in patterns:
+            if not any(earlier in pattern for earlier, _ in ordered):
+                ordered.append((pattern, domain))
+    return ordered
+
+
+_DOMAIN_PATTERNS = _ordered_domain_patterns()
+
+
+def _build_domain_automaton():
+    """Build an Aho-Corasick automaton mapping each pattern to (priority, domain)"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (pattern, domain) in enumerate(_DOMAIN_PATTERNS):
+        automaton.add_word(pattern, (priority, domain))
+    automaton.make_automaton()
+    return automaton
+
+
+# One automaton over every domain pattern for single-pass path matching
+_DOMAIN_AUTOMATON = _build_domain_automaton()
+
+# Regex fallback: alternatives are tried in priority order at position 0, each
+# lookahead scanning the whole path in C, so the first group hit is the
+# highest-priority pattern present anywhere in the path
+_DOMAIN_RE = re.compile(
+    r'\A(?:' + '|'.join(
+        f'(?=.*?(?P<g{i}>{re.escape(pattern)}))' for i, (pattern, _) in enumerate(_DOMAIN_PATTERNS)
+    ) + ')',
+    re.DOTALL
+)
+_DOMAIN_RE_GROUPS = {f'g{i}': domain for i, (_, domain) in enumerate(_DOMAIN_PATTERNS)}
+
+
+def _match_domain_folder(path_lower: str) -> Optional[str]:
+    """Return the highest-priority domain whose pattern occurs in the path"""
+    if _DOMAIN_AUTOMATON is not None:
+        best = min((value for _, value in _DOMAIN_AUTOMATON.iter(path_lower)), default=None)
+        return best[1] if best else None
+    match = _DOMAIN_RE.match(path_lower)
+    return _DOMAIN_RE_GROUPS[match.lastgroup] if match else None
+
+
+def _split_path(file_path: str) -> List[str]:
+    """Path components as pathlib.PurePosixPath.parts yields them, minus the root"""
+    return [part for part in file_path.split('/') if part and part != '.']
+
+
+def _file_name(file_path: str) -> str:
+    """Equivalent of Path(file_path).name using string operations"""
+    name = file_path.rpartition('/')[2]
+    if name and name != '.':
+        return name
+    parts = _split_path(file_path)
+    return parts[-1] if parts else ''
+
+
+def _loads(data: bytes) -> Any:
+    """Parse raw JSON bytes, preferring orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class DocumentationGenerator:
     def __init__(self):
@@ -18,12 +155,12 @@ class DocumentationGenerator:
         self.docs_dir = Path('/app/docs/migration')
         self.docs_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load all JSON reports with fallbacks
-        self.extraction_results = self._load_json('extraction_results_all.json')
+        # Load all JSON reports with fallbacks; extraction services are reduced
+        # to the fields the report uses while they are read
+        self.frontend_services, self.backend_services = self._load_extraction_services()
         self.extraction_errors = self._load_json('extraction_error_report.json')
         self.transformation_report = self._load_json('transformation_report.json')
         self.generation_report = self._load_json('generation_report.json')
-        self.complete_analysis = self._load_json('complete_analysis.json')
         self.file_disposition = self._load_json('file_disposition_report.json')
         
         # Load Master Mapping
@@ -32,79 +169,106 @@ class DocumentationGenerator:
         # Pre-process frontend files from ALL sources to ensure we have data
         self.all_frontend_files = self._aggregate_frontend_files()
 
+    @cached_property
+    def complete_analysis(self) -> Dict:
+        """Full analysis report; not needed for the report itself, so only read on access"""
+        return self._load_json('complete_analysis.json')
+
     def _load_json(self, filename: str) -> Dict:
         """Robust JSON loader"""
         filepath = self.migration_dir / filename
         if filepath.exists():
             try:
-                with open(filepath, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                return _loads(filepath.read_bytes())
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
                 print(f"⚠️ Warning: Could not decode {filename}")
                 return {}
         return {}
     
+    def _load_extraction_services(self) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Read extraction_results_all.json and split its services into frontend
+        and backend lists in one pass. With ijson installed the services array
+        is streamed, so the full report is never held in memory.
+        """
+        filename = 'extraction_results_all.json'
+        if not IJSON_AVAILABLE:
+            return self._split_services(self._load_json(filename).get('services', []))
+        
+        filepath = self.migration_dir / filename
+        if not filepath.exists():
+            return [], []
+        try:
+            with open(filepath, 'rb') as f:
+                return self._split_services(ijson.items(f, 'services.item'))
+        except ijson.JSONError:
+            print(f"⚠️ Warning: Could not decode {filename}")
+            return [], []
+
+    @staticmethod
+    def _split_services(services: Iterable[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Classify extraction services, keeping only the fields the report reads"""
+        frontend, backend = [], []
+        for service in services:
+            light = {key: service[key] for key in _SERVICE_FIELDS if key in service}
+            light['num_classes'] = len(service.get('classes', []))
+            light['num_functions'] = len(service.get('standalone_functions', []))
+            
+            # Check explicit platform flag or file extension
+            is_frontend = service.get('platform') == 'frontend'
+            if not is_frontend:
+                fname = str(service.get('file', '')).lower()
+                if fname.endswith(_FRONTEND_EXTS) and '_service.py' not in fname:
+                    is_frontend = True
+            if is_frontend:
+                frontend.append(light)
+            
+            # Anything not explicitly flagged frontend is reported as backend
+            if service.get('platform') != 'frontend':
+                backend.append(light)
+        return frontend, backend
+
     def _load_master_mapping(self) -> Dict:
         """Load the MAMS Master Mapping with multiple path checks"""
-        possible_paths = [
-            Path('/app/MAMS_MASTER_MAPPING.json'),
-            Path('./MAMS_MASTER_MAPPING.json'),
-            Path('../MAMS_MASTER_MAPPING.json'),
-            Path('/Users/pregenie/Development/arkyvus_project/MAMS_MASTER_MAPPING.json')
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
+        candidates = _MASTER_MAPPING_CANDIDATES
+        override = os.environ.get('MAMS_MASTER_MAPPING_PATH')
+        if override:
+            candidates = (override,) + candidates
+        
+        for path in candidates:
+            # isfile is a single stat and already False for missing paths
+            if os.path.isfile(path):
                 try:
-                    with open(path, 'r') as f:
-                        print(f"✅ Loaded Master Mapping from {path}")
-                        return json.load(f)
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                    print(f"✅ Loaded Master Mapping from {path}")
+                    return _loads(data)
                 except:
                     continue
         print("⚠️ Warning: Master Mapping not found.")
         return {'mappings': {}}
 
-    def _infer_domain_from_path(self, file_path: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _infer_domain_from_path(file_path: str) -> str:
         """
         Intelligently infer domain from file path patterns.
         Based on common React/TypeScript project structures.
+        Memoized: the result depends only on the path string.
         """
         path_lower = file_path.lower()
-        path_parts = Path(file_path).parts
         
-        # Check for explicit domain folders
-        domain_folders = {
-            'auth': ['auth', 'authentication', 'login', 'signup', 'session'],
-            'user': ['user', 'users', 'profile', 'account', 'settings'],
-            'dashboard': ['dashboard', 'home', 'overview', 'analytics'],
-            'admin': ['admin', 'administration', 'management', 'superuser'],
-            'api': ['api', 'services', 'endpoints', 'client'],
-            'content': ['content', 'articles', 'posts', 'blog', 'media'],
-            'commerce': ['commerce', 'shop', 'cart', 'checkout', 'payment', 'order'],
-            'messaging': ['message', 'messaging', 'chat', 'notification', 'email'],
-            'search': ['search', 'filter', 'query', 'find'],
-            'report': ['report', 'reports', 'analytics', 'metrics', 'statistics'],
-            'security': ['security', 'permission', 'role', 'access', 'guard'],
-            'workflow': ['workflow', 'process', 'task', 'job', 'queue'],
-            'integration': ['integration', 'webhook', 'sync', 'import', 'export'],
-            'ui': ['components', 'ui', 'ux', 'design', 'layout', 'theme'],
-            'shared': ['shared', 'common', 'utils', 'helpers', 'lib'],
-            'test': ['test', 'tests', 'spec', 'testing', '__test__', '__tests__']
-        }
+        # Check path for domain indicators; every path component is a substring
+        # of the full path, so matching against path_lower covers both
+        domain = _match_domain_folder(path_lower)
+        if domain:
+            return domain
         
-        # Check path parts for domain indicators
-        for domain, patterns in domain_folders.items():
-            for pattern in patterns:
-                # Check if pattern appears in any path component
-                for part in path_parts:
-                    if pattern in part.lower():
-                        return domain
-                # Check if pattern appears in the full path
-                if pattern in path_lower:
-                    return domain
-        
-        # Check file name patterns
-        filename = Path(file_path).name.lower()
+        # Check file name patterns; lowercasing never adds separators, so the
+        # lowered components line up index-for-index with the original ones
+        path_parts = _split_path(file_path)
+        parts_lower = _split_path(path_lower)
+        filename = parts_lower[-1] if parts_lower else ''
         
         # Specific file pattern checks
         if 'auth' in filename or 'login' in filename or 'signup' in filename:
@@ -122,51 +286,29 @@ class DocumentationGenerator:
         elif 'test' in filename or 'spec' in filename:
             return 'test'
         
-        # Check parent directories for context
-        if len(path_parts) > 2:
-            parent_dir = path_parts[-2].lower()
-            for domain, patterns in domain_folders.items():
-                if any(pattern in parent_dir for pattern in patterns):
-                    return domain
-        
-        # Check for page/route patterns
-        if '/pages/' in path_lower or '/routes/' in path_lower or '/views/' in path_lower:
-            # Try to extract domain from page path
-            for i, part in enumerate(path_parts):
-                if part in ['pages', 'routes', 'views'] and i + 1 < len(path_parts):
-                    next_part = path_parts[i + 1].lower()
-                    # Map common page names to domains
-                    if next_part in domain_folders:
-                        return next_part
-                    for domain, patterns in domain_folders.items():
-                        if next_part in patterns:
-                            return domain
-        
-        # If still no match, check for feature modules
+        # Every component is a substring of path_lower, which has already been
+        # checked against all domain patterns above, so folder names cannot map
+        # to a known domain here; a feature module name is used as-is instead
         if '/features/' in path_lower or '/modules/' in path_lower:
             for i, part in enumerate(path_parts):
                 if part in ['features', 'modules'] and i + 1 < len(path_parts):
-                    feature_name = path_parts[i + 1].lower()
-                    # Try to map feature to domain
-                    for domain, patterns in domain_folders.items():
-                        if feature_name in patterns or any(p in feature_name for p in patterns):
-                            return domain
+                    feature_name = parts_lower[i + 1]
                     # Use feature name as domain if it's reasonable
                     if len(feature_name) > 2 and feature_name.isalpha():
                         return feature_name
         
         # Default to 'ui' for component files, 'shared' for utilities
-        if any(path_lower.endswith(ext) for ext in ['.tsx', '.jsx']):
-            if 'component' in path_lower or 'view' in path_lower:
+        if path_lower.endswith(_COMPONENT_EXTS):
+            if any(hint in path_lower for hint in _UI_HINTS):
                 return 'ui'
-            elif 'util' in path_lower or 'helper' in path_lower or 'hook' in path_lower:
+            elif any(hint in path_lower for hint in _SHARED_HINTS):
                 return 'shared'
         
         # Last resort - try to use the most specific directory
-        for part in reversed(path_parts[:-1]):  # Exclude filename
-            if part.lower() not in ['src', 'client', 'app', 'lib', 'dist', 'build', 'node_modules']:
+        for part, part_lower in zip(reversed(path_parts[:-1]), reversed(parts_lower[:-1])):  # Exclude filename
+            if part_lower not in ['src', 'client', 'app', 'lib', 'dist', 'build', 'node_modules']:
                 if len(part) > 2 and not part.startswith('.'):
-                    return part.lower()
+                    return part_lower
         
         return 'misc'  # Only if no pattern matches
 
@@ -178,26 +320,17 @@ class DocumentationGenerator:
         frontend_files = {} # Key by file path to deduplicate
 
         # Source 1: Extraction Results (The most accurate source of what was processed)
-        services = self.extraction_results.get('services', [])
-        for service in services:
-            # Check explicit platform flag or file extension
-            is_frontend = service.get('platform') == 'frontend'
-            if not is_frontend:
-                fname = str(service.get('file', '')).lower()
-                if any(fname.endswith(ext) for ext in ['.tsx', '.ts', '.jsx', '.js']) and '_service.py' not in fname:
-                    is_frontend = True
-            
-            if is_frontend:
-                file_path = service.get('file')
-                if file_path:
-                    frontend_files[file_path] = {
-                        'file': file_path,
-                        'name': Path(file_path).name,
-                        'domain': service.get('domain') or self._infer_domain_from_path(file_path),
-                        'type': service.get('file_type') or 'component',
-                        'target': service.get('target') or '',
-                        'source': 'extraction'
-                    }
+        for service in self.frontend_services:
+            file_path = service.get('file')
+            if file_path:
+                frontend_files[file_path] = {
+                    'file': file_path,
+                    'name': _file_name(file_path),
+                    'domain': service.get('domain') or self._infer_domain_from_path(file_path),
+                    'type': service.get('file_type') or 'component',
+                    'target': service.get('target') or '',
+                    'source': 'extraction'
+                }
 
         # Source 2: Master Mapping (Fill in gaps)
         mapping = self.master_mapping.get('mappings', {})
@@ -207,7 +340,7 @@ class DocumentationGenerator:
                 if file_path not in frontend_files:
                     frontend_files[file_path] = {
                         'file': file_path,
-                        'name': Path(file_path).name,
+                        'name': _file_name(file_path),
                         'domain': info.get('domain') or self._infer_domain_from_path(file_path),
                         'type': info.get('file_type') or 'component',
                         'target': info.get('target') or '',
@@ -221,28 +354,38 @@ class DocumentationGenerator:
             for category, files in self.file_disposition.items():
                 if isinstance(files, list):
                     for file_path in files:
-                        if any(str(file_path).endswith(ext) for ext in ['.tsx', '.ts', '.jsx', '.js']):
-                            if file_path not in frontend_files:
-                                # Intelligently assign domain based on path patterns
-                                inferred_domain = self._infer_domain_from_path(str(file_path))
-                                frontend_files[file_path] = {
-                                    'file': file_path,
-                                    'name': Path(file_path).name,
-                                    'domain': inferred_domain,
-                                    'type': 'component',
-                                    'target': '',
-                                    'source': 'disposition'
-                                }
+                        file_path = str(file_path)
+                        if not file_path.endswith(_FRONTEND_EXTS) or file_path in frontend_files:
+                            continue
+                        # Intelligently assign domain based on path patterns
+                        frontend_files[file_path] = {
+                            'file': file_path,
+                            'name': _file_name(file_path),
+                            'domain': self._infer_domain_from_path(file_path),
+                            'type': 'component',
+                            'target': '',
+                            'source': 'disposition'
+                        }
 
         print(f"📊 Aggregated {len(frontend_files)} frontend files from all sources.")
         
-        # Report domain distribution for validation
-        domain_counts = defaultdict(int)
-        for f in frontend_files.values():
-            domain_counts[f['domain']] += 1
+        # Compute every breakdown the report needs up front; Counter tallies in C.
+        # Every domain and type is non-empty by construction - each source above
+        # falls back with `or infer` / `or 'component'` - so no 'unknown' bucket
+        # is ever needed
+        files = frontend_files.values()
+        self._domain_counts = Counter(map(itemgetter('domain'), files))
+        self._type_counts = Counter(map(itemgetter('type'), files))
+        self._source_counts = Counter(map(itemgetter('source'), files))
+        # Grouped in name order, ready for the detailed mapping tables
+        self._by_domain = defaultdict(list)
+        for f in sorted(files, key=itemgetter('name')):
+            self._by_domain[f['domain']].append(f)
         
+        # Report domain distribution for validation
+        domain_counts = self._domain_counts
         print("Domain distribution:")
-        for domain, count in sorted(domain_counts.items(), key=lambda x: x[1], reverse=True):
+        for domain, count in domain_counts.most_common():
             percentage = (count / len(frontend_files)) * 100 if frontend_files else 0
             print(f"  {domain}: {count} files ({percentage:.1f}%)")
         
@@ -255,229 +398,205 @@ class DocumentationGenerator:
         
         return list(frontend_files.values())
     
-    def generate_documentation(self) -> str:
+    def generate_documentation(self, now: Optional[datetime] = None) -> str:
         """Generate comprehensive migration documentation"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = (now or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
         
-        doc = []
-        doc.append("# MAMS Comprehensive Platform Migration Report")
-        doc.append(f"\n**Generated:** {timestamp}")
-        doc.append(f"**Total Frontend Files Detected:** {len(self.all_frontend_files)}")
-        doc.append("---\n")
+        buf = io.StringIO()
+        buf.write("# MAMS Comprehensive Platform Migration Report\n")
+        buf.write(f"\n**Generated:** {timestamp}\n")
+        buf.write(f"**Total Frontend Files Detected:** {len(self.all_frontend_files)}\n")
+        buf.write("---\n\n")
         
         # Navigation
-        doc.append("## Index")
-        doc.append("- [Executive Summary](#executive-summary)")
-        doc.append("- [Frontend Migration Status](#frontend-migration-status)")
-        doc.append("- [Backend Migration Status](#backend-migration-status)")
-        doc.append("- [Detailed Component Mapping](#detailed-component-mapping)")
-        doc.append("---\n")
+        buf.write("## Index\n")
+        buf.write("- [Executive Summary](#executive-summary)\n")
+        buf.write("- [Frontend Migration Status](#frontend-migration-status)\n")
+        buf.write("- [Backend Migration Status](#backend-migration-status)\n")
+        buf.write("- [Detailed Component Mapping](#detailed-component-mapping)\n")
+        buf.write("---\n\n")
         
         # Executive Summary
-        doc.append("## Executive Summary")
-        doc.append(self._generate_summary())
+        buf.write("## Executive Summary\n")
+        self._generate_summary(buf)
         
         # Frontend Section (The Priority)
-        doc.append("\n## Frontend Migration Status")
-        doc.append(self._generate_frontend_section())
+        buf.write("\n## Frontend Migration Status\n")
+        self._generate_frontend_section(buf)
         
         # Backend Section
-        doc.append("\n## Backend Migration Status")
-        doc.append(self._generate_backend_section())
+        buf.write("\n## Backend Migration Status\n")
+        self._generate_backend_section(buf)
 
         # Detailed Mapping
-        doc.append("\n## Detailed Component Mapping")
-        doc.append(self._generate_detailed_mapping())
+        buf.write("\n## Detailed Component Mapping\n")
+        self._generate_detailed_mapping(buf)
         
-        return '\n'.join(doc)
+        # Every line was written with a trailing newline; the report has
+        # always ended without one
+        return buf.getvalue()[:-1]
     
-    def _generate_summary(self) -> str:
+    def _generate_summary(self, buf: io.StringIO) -> None:
         # Calculate stats
-        backend_files = sum(1 for s in self.extraction_results.get('services', []) if s.get('platform') != 'frontend')
+        backend_files = len(self.backend_services)
         frontend_files = len(self.all_frontend_files)
         
         # Check for errors
         total_errors = len(self.extraction_errors.get('errors', []))
         
-        summary = []
-        summary.append("| Metric | Value |")
-        summary.append("|--------|-------|")
-        summary.append(f"| **Backend Files** | {backend_files} |")
-        summary.append(f"| **Frontend Files** | {frontend_files} |")
-        summary.append(f"| **Total Processed** | {backend_files + frontend_files} |")
-        summary.append(f"| **Extraction Errors** | {total_errors} |")
+        buf.write("| Metric | Value |\n")
+        buf.write("|--------|-------|\n")
+        buf.write(f"| **Backend Files** | {backend_files} |\n")
+        buf.write(f"| **Frontend Files** | {frontend_files} |\n")
+        buf.write(f"| **Total Processed** | {backend_files + frontend_files} |\n")
+        buf.write(f"| **Extraction Errors** | {total_errors} |\n")
         
         # Add completion percentage if we have mapping data
         if self.master_mapping.get('mappings'):
             total_mapped = len(self.master_mapping['mappings'])
             if total_mapped > 0:
                 completion = round(((backend_files + frontend_files) / total_mapped) * 100, 2)
-                summary.append(f"| **Migration Progress** | {completion}% |")
-        
-        return '\n'.join(summary)
+                buf.write(f"| **Migration Progress** | {completion}% |\n")
 
-    def _generate_frontend_section(self) -> str:
+    def _generate_frontend_section(self, buf: io.StringIO) -> None:
         if not self.all_frontend_files:
-            return "\n> ⚠️ No frontend files were detected in the analysis output.\n"
+            buf.write("\n> ⚠️ No frontend files were detected in the analysis output.\n\n")
+            return
 
-        section = []
-        
         # Domain Breakdown
-        domain_counts = defaultdict(int)
-        for f in self.all_frontend_files:
-            domain = f.get('domain') or 'unknown'
-            domain_counts[domain] += 1
-            
-        section.append("\n### Domain Breakdown")
-        section.append("| Domain | Count |")
-        section.append("|--------|-------|")
-        for domain, count in sorted(domain_counts.items(), key=lambda x: x[1], reverse=True):
-            section.append(f"| {domain} | {count} |")
+        domain_counts = self._domain_counts
+        buf.write("\n### Domain Breakdown\n")
+        buf.write("| Domain | Count |\n")
+        buf.write("|--------|-------|\n")
+        for domain, count in domain_counts.most_common():
+            buf.write(f"| {domain} | {count} |\n")
             
         # Type Breakdown
-        type_counts = defaultdict(int)
-        for f in self.all_frontend_files:
-            file_type = f.get('type') or 'unknown'
-            type_counts[file_type] += 1
-            
-        section.append("\n### Component Type Breakdown")
-        section.append("| Type | Count |")
-        section.append("|------|-------|")
-        for ftype, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
-            section.append(f"| {ftype} | {count} |")
+        type_counts = self._type_counts
+        buf.write("\n### Component Type Breakdown\n")
+        buf.write("| Type | Count |\n")
+        buf.write("|------|-------|\n")
+        for ftype, count in type_counts.most_common():
+            buf.write(f"| {ftype} | {count} |\n")
             
         # Source Breakdown to show data quality
-        source_counts = defaultdict(int)
-        for f in self.all_frontend_files:
-            source_counts[f.get('source', 'unknown')] += 1
-            
-        section.append("\n### Data Source Breakdown")
-        section.append("| Source | Count | Description |")
-        section.append("|--------|-------|-------------|")
+        source_counts = self._source_counts
+        buf.write("\n### Data Source Breakdown\n")
+        buf.write("| Source | Count | Description |\n")
+        buf.write("|--------|-------|-------------|\n")
         for source, count in sorted(source_counts.items()):
             desc = {
                 'extraction': 'Actively processed files',
                 'mapping': 'From master mapping (not yet processed)',
                 'disposition': 'Discovered but uncategorized'
             }.get(source, 'Unknown source')
-            section.append(f"| {source} | {count} | {desc} |")
-            
-        return '\n'.join(section)
+            buf.write(f"| {source} | {count} | {desc} |\n")
 
-    def _generate_backend_section(self) -> str:
-        section = []
-        services = [s for s in self.extraction_results.get('services', []) if s.get('platform') != 'frontend']
+    def _generate_backend_section(self, buf: io.StringIO) -> None:
+        services = self.backend_services
         
         if not services:
-            return "\n> No backend services found in extraction results.\n"
+            buf.write("\n> No backend services found in extraction results.\n\n")
+            return
             
-        section.append(f"\nFound {len(services)} backend service candidates.")
+        buf.write(f"\nFound {len(services)} backend service candidates.\n")
         
         # Group by extracted classes
-        total_classes = sum(len(s.get('classes', [])) for s in services)
-        section.append(f"- **Classes Extracted:** {total_classes}")
+        total_classes = sum(s['num_classes'] for s in services)
+        buf.write(f"- **Classes Extracted:** {total_classes}\n")
         
         # Domain breakdown for backend
-        backend_domains = defaultdict(int)
-        for s in services:
-            backend_domains[s.get('domain', 'unknown')] += 1
-            
-        section.append("\n### Backend Domain Distribution")
-        section.append("| Domain | Count |")
-        section.append("|--------|-------|")
-        for domain, count in sorted(backend_domains.items(), key=lambda x: x[1], reverse=True)[:10]:
-            section.append(f"| {domain} | {count} |")
-            
-        return '\n'.join(section)
+        backend_domains = Counter(s.get('domain', 'unknown') for s in services)
+        buf.write("\n### Backend Domain Distribution\n")
+        buf.write("| Domain | Count |\n")
+        buf.write("|--------|-------|\n")
+        for domain, count in backend_domains.most_common(10):
+            buf.write(f"| {domain} | {count} |\n")
 
-    def _generate_detailed_mapping(self) -> str:
-        section = []
-        
+    def _generate_detailed_mapping(self, buf: io.StringIO) -> None:
         # BACKEND Detailed Mapping
-        section.append("\n## Backend Service Mapping\n")
-        backend_services = [s for s in self.extraction_results.get('services', []) 
-                           if s.get('platform') != 'frontend']
+        buf.write("\n## Backend Service Mapping\n\n")
+        backend_services = self.backend_services
         
         if backend_services:
-            # Group backend by domain
+            # Group backend by domain; sorting by file first leaves every
+            # group in file order, so each table needs no sort of its own
             backend_by_domain = defaultdict(list)
-            for service in backend_services:
+            for service in sorted(backend_services, key=lambda x: x.get('file', '')):
                 domain = service.get('domain') or 'unknown'
                 backend_by_domain[domain].append(service)
             
             for domain, services in sorted(backend_by_domain.items(), 
                                           key=lambda x: (-len(x[1]), x[0])):  # Sort by count desc, then name
-                section.append(f"\n### Backend Domain: {domain.upper()} ({len(services)} files)")
-                section.append("| File Path | Service | Classes | Functions | Target |")
-                section.append("|-----------|---------|---------|-----------|--------|")
+                buf.write(f"\n### Backend Domain: {domain.upper()} ({len(services)} files)\n")
+                buf.write("| File Path | Service | Classes | Functions | Target |\n")
+                buf.write("|-----------|---------|---------|-----------|--------|\n")
                 
                 # Show ALL backend files - no truncation for validation
-                for service in sorted(services, key=lambda x: x.get('file', '')):
+                for service in services:
                     file_path = service.get('file', '-')
-                    service_name = service.get('service', Path(file_path).stem)
-                    num_classes = len(service.get('classes', []))
-                    num_functions = len(service.get('standalone_functions', []))
+                    service_name = service['service'] if 'service' in service else Path(file_path).stem
+                    num_classes = service['num_classes']
+                    num_functions = service['num_functions']
                     target = service.get('target', f'unified_{domain}_service')
                     
                     # Shorten path for readability
                     if len(file_path) > 60:
                         file_path = "..." + file_path[-57:]
                     
-                    section.append(f"| {file_path} | {service_name} | {num_classes} | {num_functions} | {target} |")
+                    buf.write(f"| {file_path} | {service_name} | {num_classes} | {num_functions} | {target} |\n")
         else:
-            section.append("No backend services found in extraction results.")
+            buf.write("No backend services found in extraction results.\n")
         
         # FRONTEND Detailed Mapping
-        section.append("\n## Frontend Component Mapping\n")
+        buf.write("\n## Frontend Component Mapping\n\n")
         
         if not self.all_frontend_files:
-            section.append("No frontend mapping data available.")
+            buf.write("No frontend mapping data available.\n")
         else:
-            # Group by Domain
-            by_domain = defaultdict(list)
-            for f in self.all_frontend_files:
-                # Handle None or missing domains
-                domain = f.get('domain') or 'unknown'
-                by_domain[domain].append(f)
-                
+            # Group by Domain (precomputed during aggregation)
+            by_domain = self._by_domain
+            
             # Sort domains, handling any edge cases
             for domain, files in sorted(by_domain.items(), 
                                        key=lambda x: (-len(x[1]), x[0] or '')):  # Sort by count desc, then name
-                section.append(f"\n### Frontend Domain: {domain.upper()} ({len(files)} files)")
-                section.append("| File Name | Type | Target Path | Source |")
-                section.append("|-----------|------|-------------|--------|")
+                buf.write(f"\n### Frontend Domain: {domain.upper()} ({len(files)} files)\n")
+                buf.write("| File Name | Type | Target Path | Source |\n")
+                buf.write("|-----------|------|-------------|--------|\n")
                 
                 # Show ALL files - no truncation for validation
-                for f in sorted(files, key=lambda x: x['name']):
+                for f in files:
                     name = f['name']
                     ftype = f['type']
                     target = f['target'] if f['target'] else '-'
                     src = f['source']
-                    section.append(f"| {name} | {ftype} | {target} | {src} |")
-                
-        return '\n'.join(section)
+                    buf.write(f"| {name} | {ftype} | {target} | {src} |\n")
 
     def publish(self):
         """Generate and save documentation"""
         try:
-            doc_content = self.generate_documentation()
+            # One clock read so the report header and file name always agree
+            now = datetime.now()
+            doc_content = self.generate_documentation(now)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             main_report = self.docs_dir / f"MAMS_Migration_Report_{timestamp}.md"
             
-            with open(main_report, 'w') as f:
-                f.write(doc_content)
+            # Encode once and hand the whole report to a single write
+            main_report.write_bytes(doc_content.encode('utf-8'))
             
-            # Create latest link
+            # Create latest link: stage it beside the target, then swap it in
+            # atomically so readers never see a missing or half-written file
             latest = self.docs_dir / "MAMS_Migration_Report_Latest.md"
-            if latest.exists():
-                latest.unlink()
+            staged = latest.with_name(latest.name + '.tmp')
+            staged.unlink(missing_ok=True)
             try:
-                latest.symlink_to(main_report.name)
+                staged.symlink_to(main_report.name)
             except OSError:
-                # Fallback if symlinks aren't supported
-                with open(latest, 'w') as f:
-                    f.write(doc_content)
+                # Fallback if symlinks aren't supported; copyfile uses the
+                # kernel's copy path instead of writing the content again
+                shutil.copyfile(main_report, staged)
+            os.replace(staged, latest)
             
             print(f"\n✅ Documentation generated successfully!")
             print(f"   Path: {main_report}")
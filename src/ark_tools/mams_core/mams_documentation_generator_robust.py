@@ -5,12 +5,60 @@ Generates comprehensive documentation from migration JSON outputs.
 Robustly handles missing data by cross-referencing multiple JSON sources.
 """
 
+import io
 import json
 import os
+import shutil
 from datetime import datetime
 from pathlib import Path
+from sys import intern
 from typing import Dict, Any, List, Optional, Set
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+
+# Fastest available decoder for the report bytes: orjson, then ujson, then stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        _loads = json.loads
+
+# Sort key for file rows; attrgetter runs in C, unlike an equivalent lambda
+_NAME_KEY = attrgetter('name')
+
+# Extensions that mark a file as frontend source
+_FRONTEND_EXTS = ('.tsx', '.ts', '.jsx', '.js')
+
+
+def _interned(value: Any) -> Any:
+    """Intern string field values so the many repeats share one object"""
+    return intern(value) if type(value) is str else value
+
+
+def _file_name(file_path: str) -> str:
+    """Equivalent of Path(file_path).name using string operations"""
+    name = file_path.rpartition('/')[2]
+    if name and name != '.':
+        return name
+    parts = [part for part in file_path.split('/') if part and part != '.']
+    return parts[-1] if parts else ''
+
+@dataclass(slots=True, frozen=True)
+class FrontendFile:
+    """One aggregated frontend file and where its metadata came from"""
+    file: str
+    name: str
+    domain: str
+    type: str
+    target: str
+    source: str
+
 
 class DocumentationGenerator:
     def __init__(self):
@@ -18,31 +66,51 @@ class DocumentationGenerator:
         self.docs_dir = Path('/app/docs/migration')
         self.docs_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load all JSON reports with fallbacks
-        self.extraction_results = self._load_json('extraction_results_all.json')
-        self.extraction_errors = self._load_json('extraction_error_report.json')
-        self.transformation_report = self._load_json('transformation_report.json')
-        self.generation_report = self._load_json('generation_report.json')
-        self.complete_analysis = self._load_json('complete_analysis.json')
-        self.file_disposition = self._load_json('file_disposition_report.json')
+        # Load all JSON reports (and the Master Mapping) with fallbacks; file
+        # reads release the GIL, so a small pool overlaps the I/O while each
+        # decode still runs one at a time
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            extraction_results = pool.submit(self._load_json, 'extraction_results_all.json')
+            extraction_errors = pool.submit(self._load_json, 'extraction_error_report.json')
+            transformation_report = pool.submit(self._load_json, 'transformation_report.json')
+            generation_report = pool.submit(self._load_json, 'generation_report.json')
+            complete_analysis = pool.submit(self._load_json, 'complete_analysis.json')
+            file_disposition = pool.submit(self._load_json, 'file_disposition_report.json')
+            master_mapping = pool.submit(self._load_master_mapping)
         
-        # Load Master Mapping
-        self.master_mapping = self._load_master_mapping()
+        self.extraction_results = extraction_results.result()
+        self.extraction_errors = extraction_errors.result()
+        self.transformation_report = transformation_report.result()
+        self.generation_report = generation_report.result()
+        self.complete_analysis = complete_analysis.result()
+        self.file_disposition = file_disposition.result()
+        self.master_mapping = master_mapping.result()
         
         # Pre-process frontend files from ALL sources to ensure we have data
         self.all_frontend_files = self._aggregate_frontend_files()
+        
+        # Domain grouping and breakdown counts shared by every section
+        self._by_domain = defaultdict(list)
+        self._domain_counts = Counter()
+        self._type_counts = Counter()
+        for f in self.all_frontend_files:
+            domain = f.domain
+            self._by_domain[domain].append(f)
+            self._domain_counts[domain] += 1
+            self._type_counts[f.type] += 1
 
     def _load_json(self, filename: str) -> Dict:
         """Robust JSON loader"""
         filepath = self.migration_dir / filename
-        if filepath.exists():
-            try:
-                with open(filepath, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                print(f"⚠️ Warning: Could not decode {filename}")
-                return {}
-        return {}
+        try:
+            data = filepath.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+        try:
+            return _loads(data)
+        except ValueError:  # JSONDecodeError of every decoder subclasses ValueError
+            print(f"⚠️ Warning: Could not decode {filename}")
+            return {}
     
     def _load_master_mapping(self) -> Dict:
         """Load the MAMS Master Mapping with multiple path checks"""
@@ -54,17 +122,21 @@ class DocumentationGenerator:
         ]
         
         for path in possible_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r') as f:
-                        print(f"✅ Loaded Master Mapping from {path}")
-                        return json.load(f)
-                except:
-                    continue
+            # Read directly rather than stat first; an unreadable candidate
+            # (missing, a directory, no permission) just falls through
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            try:
+                print(f"✅ Loaded Master Mapping from {path}")
+                return _loads(data)
+            except:
+                continue
         print("⚠️ Warning: Master Mapping not found.")
         return {'mappings': {}}
 
-    def _aggregate_frontend_files(self) -> List[Dict]:
+    def _aggregate_frontend_files(self) -> List[FrontendFile]:
         """
         Crucial Fix: Aggregate frontend files from all possible sources.
         Prioritizes Extraction Results (real-time), then Master Mapping (static).
@@ -78,20 +150,20 @@ class DocumentationGenerator:
             is_frontend = service.get('platform') == 'frontend'
             if not is_frontend:
                 fname = str(service.get('file', '')).lower()
-                if any(fname.endswith(ext) for ext in ['.tsx', '.ts', '.jsx', '.js']) and '_service.py' not in fname:
+                if fname.endswith(_FRONTEND_EXTS) and '_service.py' not in fname:
                     is_frontend = True
             
             if is_frontend:
                 file_path = service.get('file')
                 if file_path:
-                    frontend_files[file_path] = {
-                        'file': file_path,
-                        'name': Path(file_path).name,
-                        'domain': service.get('domain', 'misc'),
-                        'type': service.get('file_type', 'component'),
-                        'target': service.get('target', ''),
-                        'source': 'extraction'
-                    }
+                    frontend_files[file_path] = FrontendFile(
+                        file=file_path,
+                        name=_file_name(file_path),
+                        domain=_interned(service.get('domain', 'misc')),
+                        type=_interned(service.get('file_type', 'component')),
+                        target=service.get('target', ''),
+                        source='extraction'
+                    )
 
         # Source 2: Master Mapping (Fill in gaps)
         mapping = self.master_mapping.get('mappings', {})
@@ -99,14 +171,14 @@ class DocumentationGenerator:
             if info.get('platform') == 'frontend':
                 # Normalize path
                 if file_path not in frontend_files:
-                    frontend_files[file_path] = {
-                        'file': file_path,
-                        'name': Path(file_path).name,
-                        'domain': info.get('domain', 'misc'),
-                        'type': info.get('file_type', 'component'),
-                        'target': info.get('target', ''),
-                        'source': 'mapping'
-                    }
+                    frontend_files[file_path] = FrontendFile(
+                        file=file_path,
+                        name=_file_name(file_path),
+                        domain=_interned(info.get('domain', 'misc')),
+                        type=_interned(info.get('file_type', 'component')),
+                        target=info.get('target', ''),
+                        source='mapping'
+                    )
 
         # Source 3: File Disposition (Last resort)
         # Often file_disposition just has strings, so we infer metadata
@@ -115,161 +187,149 @@ class DocumentationGenerator:
             for category, files in self.file_disposition.items():
                 if isinstance(files, list):
                     for file_path in files:
-                        if any(str(file_path).endswith(ext) for ext in ['.tsx', '.ts', '.jsx', '.js']):
-                            if file_path not in frontend_files:
-                                frontend_files[file_path] = {
-                                    'file': file_path,
-                                    'name': Path(file_path).name,
-                                    'domain': 'misc', # Unknown
-                                    'type': 'component',
-                                    'target': '',
-                                    'source': 'disposition'
-                                }
+                        file_path = str(file_path)
+                        if not file_path.endswith(_FRONTEND_EXTS) or file_path in frontend_files:
+                            continue
+                        frontend_files[file_path] = FrontendFile(
+                            file=file_path,
+                            name=_file_name(file_path),
+                            domain='misc', # Unknown
+                            type='component',
+                            target='',
+                            source='disposition'
+                        )
 
         print(f"📊 Aggregated {len(frontend_files)} frontend files from all sources.")
         return list(frontend_files.values())
     
-    def generate_documentation(self) -> str:
+    def generate_documentation(self, now: Optional[datetime] = None) -> str:
         """Generate comprehensive migration documentation"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = (now or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
         
-        doc = []
-        doc.append("# MAMS Comprehensive Platform Migration Report")
-        doc.append(f"\n**Generated:** {timestamp}")
-        doc.append(f"**Total Frontend Files Detected:** {len(self.all_frontend_files)}")
-        doc.append("---\n")
+        buf = io.StringIO()
+        buf.write("# MAMS Comprehensive Platform Migration Report\n")
+        buf.write(f"\n**Generated:** {timestamp}\n")
+        buf.write(f"**Total Frontend Files Detected:** {len(self.all_frontend_files)}\n")
+        buf.write("---\n\n")
         
         # Navigation
-        doc.append("## Index")
-        doc.append("- [Executive Summary](#executive-summary)")
-        doc.append("- [Frontend Migration Status](#frontend-migration-status)")
-        doc.append("- [Backend Migration Status](#backend-migration-status)")
-        doc.append("- [Detailed Component Mapping](#detailed-component-mapping)")
-        doc.append("---\n")
+        buf.write("## Index\n")
+        buf.write("- [Executive Summary](#executive-summary)\n")
+        buf.write("- [Frontend Migration Status](#frontend-migration-status)\n")
+        buf.write("- [Backend Migration Status](#backend-migration-status)\n")
+        buf.write("- [Detailed Component Mapping](#detailed-component-mapping)\n")
+        buf.write("---\n\n")
         
         # Executive Summary
-        doc.append("## Executive Summary")
-        doc.append(self._generate_summary())
+        buf.write("## Executive Summary\n")
+        self._generate_summary(buf)
         
         # Frontend Section (The Priority)
-        doc.append("\n## Frontend Migration Status")
-        doc.append(self._generate_frontend_section())
+        buf.write("\n## Frontend Migration Status\n")
+        self._generate_frontend_section(buf)
         
         # Backend Section
-        doc.append("\n## Backend Migration Status")
-        doc.append(self._generate_backend_section())
+        buf.write("\n## Backend Migration Status\n")
+        self._generate_backend_section(buf)
 
         # Detailed Mapping - Shows ALL files
-        doc.append("\n## Detailed Component Mapping")
-        doc.append(self._generate_detailed_mapping())
+        buf.write("\n## Detailed Component Mapping\n")
+        self._generate_detailed_mapping(buf)
         
-        return '\n'.join(doc)
+        # Every line was written with a trailing newline; the report has
+        # always ended without one
+        return buf.getvalue()[:-1]
     
-    def _generate_summary(self) -> str:
+    def _generate_summary(self, buf: io.StringIO) -> None:
         # Calculate stats
         backend_files = sum(1 for s in self.extraction_results.get('services', []) if s.get('platform') != 'frontend')
         frontend_files = len(self.all_frontend_files)
         
-        summary = []
-        summary.append("| Metric | Value |")
-        summary.append("|--------|-------|")
-        summary.append(f"| **Backend Files** | {backend_files} |")
-        summary.append(f"| **Frontend Files** | {frontend_files} |")
-        summary.append(f"| **Total Processed** | {backend_files + frontend_files} |")
-        return '\n'.join(summary)
+        buf.write("| Metric | Value |\n")
+        buf.write("|--------|-------|\n")
+        buf.write(f"| **Backend Files** | {backend_files} |\n")
+        buf.write(f"| **Frontend Files** | {frontend_files} |\n")
+        buf.write(f"| **Total Processed** | {backend_files + frontend_files} |\n")
 
-    def _generate_frontend_section(self) -> str:
+    def _generate_frontend_section(self, buf: io.StringIO) -> None:
         if not self.all_frontend_files:
-            return "\n> ⚠️ No frontend files were detected in the analysis output.\n"
+            buf.write("\n> ⚠️ No frontend files were detected in the analysis output.\n\n")
+            return
 
-        section = []
-        
         # Domain Breakdown
-        domain_counts = defaultdict(int)
-        for f in self.all_frontend_files:
-            domain_counts[f['domain']] += 1
-            
-        section.append("\n### Domain Breakdown")
-        section.append("| Domain | Count |")
-        section.append("|--------|-------|")
-        for domain, count in sorted(domain_counts.items(), key=lambda x: x[1], reverse=True):
-            section.append(f"| {domain} | {count} |")
+        buf.write("\n### Domain Breakdown\n")
+        buf.write("| Domain | Count |\n")
+        buf.write("|--------|-------|\n")
+        for domain, count in self._domain_counts.most_common():
+            buf.write(f"| {domain} | {count} |\n")
             
         # Type Breakdown
-        type_counts = defaultdict(int)
-        for f in self.all_frontend_files:
-            type_counts[f['type']] += 1
-            
-        section.append("\n### Component Type Breakdown")
-        section.append("| Type | Count |")
-        section.append("|------|-------|")
-        for ftype, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
-            section.append(f"| {ftype} | {count} |")
-            
-        return '\n'.join(section)
+        buf.write("\n### Component Type Breakdown\n")
+        buf.write("| Type | Count |\n")
+        buf.write("|------|-------|\n")
+        for ftype, count in self._type_counts.most_common():
+            buf.write(f"| {ftype} | {count} |\n")
 
-    def _generate_backend_section(self) -> str:
-        section = []
+    def _generate_backend_section(self, buf: io.StringIO) -> None:
         services = [s for s in self.extraction_results.get('services', []) if s.get('platform') != 'frontend']
         
         if not services:
-            return "\n> No backend services found in extraction results.\n"
+            buf.write("\n> No backend services found in extraction results.\n\n")
+            return
             
-        section.append(f"\nFound {len(services)} backend service candidates.")
+        buf.write(f"\nFound {len(services)} backend service candidates.\n")
         
         # Group by extracted classes
         total_classes = sum(len(s.get('classes', [])) for s in services)
-        section.append(f"- **Classes Extracted:** {total_classes}")
-        
-        return '\n'.join(section)
+        buf.write(f"- **Classes Extracted:** {total_classes}\n")
 
-    def _generate_detailed_mapping(self) -> str:
-        section = []
-        
+    def _generate_detailed_mapping(self, buf: io.StringIO) -> None:
         if not self.all_frontend_files:
-            return "No frontend mapping data available."
+            buf.write("No frontend mapping data available.\n")
+            return
 
         # Group by Domain
-        by_domain = defaultdict(list)
-        for f in self.all_frontend_files:
-            by_domain[f['domain']].append(f)
-            
-        for domain, files in sorted(by_domain.items()):
-            section.append(f"\n### Domain: {domain.upper()} ({len(files)} files)")
-            section.append("| File Path | File Name | Target Path | Source |")
-            section.append("|-----------|-----------|-------------|--------|")
+        for domain, files in sorted(self._by_domain.items(), key=itemgetter(0)):
+            buf.write(f"\n### Domain: {domain.upper()} ({len(files)} files)\n")
+            buf.write("| File Path | File Name | Target Path | Source |\n")
+            buf.write("|-----------|-----------|-------------|--------|\n")
             
-            # Show ALL files - no truncation for validation
-            for f in sorted(files, key=lambda x: x['name']):
-                path = f['file']
-                name = f['name']
-                target = f['target'] if f['target'] else '-'
-                src = f['source']
-                section.append(f"| {path} | {name} | {target} | {src} |")
-                
-        return '\n'.join(section)
+            # Show ALL files - no truncation for validation; rows are
+            # formatted in one join and written with a single call
+            buf.write(''.join(
+                f"| {f.file} | {f.name} | {f.target or '-'} | {f.source} |\n"
+                for f in sorted(files, key=_NAME_KEY)
+            ))
 
     def publish(self):
         """Generate and save documentation"""
         try:
-            doc_content = self.generate_documentation()
+            # One clock read so the report header and file name always agree
+            now = datetime.now()
+            doc_content = self.generate_documentation(now)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             main_report = self.docs_dir / f"MAMS_Migration_Report_{timestamp}.md"
             
-            with open(main_report, 'w') as f:
-                f.write(doc_content)
+            # Encode once and hand the whole report to a single write
+            main_report.write_bytes(doc_content.encode('utf-8'))
             
-            # Create latest link
+            # Create latest link: stage it beside the target, then swap it in
+            # atomically so readers never see a missing or half-written file
             latest = self.docs_dir / "MAMS_Migration_Report_Latest.md"
-            if latest.exists():
-                latest.unlink()
+            staged = latest.with_name(latest.name + '.tmp')
+            staged.unlink(missing_ok=True)
             try:
-                latest.symlink_to(main_report.name)
+                staged.symlink_to(main_report.name)
             except OSError:
-                # Fallback if symlinks aren't supported
-                with open(latest, 'w') as f:
-                    f.write(doc_content)
+                # Fallbacks if symlinks aren't supported: a hard link shares the
+                # report's data, and copyfile is the last resort; neither writes
+                # the content a second time from Python
+                try:
+                    os.link(main_report, staged)
+                except OSError:
+                    shutil.copyfile(main_report, staged)
+            os.replace(staged, latest)
             
             print(f"\n✅ Documentation generated successfully!")
             print(f"   path: {main_report}")
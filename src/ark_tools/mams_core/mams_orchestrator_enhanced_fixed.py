@@ -713,81 +713,80 @@ class Orchestrator:
                 from arkyvus.migrations.mams_017_frontend_orchestrator_integration import FrontendMigrationOrchestrator
                 
                 async def run_frontend_suite():
-                    orchestrator = FrontendMigrationOrchestrator()
-                    
-                    # Full analysis with AST parsing
-                    print("\n📊 Running TypeScript AST Analysis...")
-                    plan = await orchestrator.analyze_frontend(confidence_threshold=0.7)
-                    
-                    print(f"\n✅ Frontend Analysis Complete:")
-                    print(f"  Files Analyzed: {plan.total_files}")
-                    print(f"  Classifications: {len(plan.classifications)}")
-                    print(f"  High Confidence: {plan.confidence_distribution.get('high', 0)}")
-                    print(f"  Review Required: {len(plan.review_required)}")
-                    
-                    # Validation
-                    print(f"\n🔍 Dependency Validation:")
-                    print(f"  Domain Violations: {len(plan.validation_report.domain_violations)}")
-                    print(f"  Circular Dependencies: {len(plan.validation_report.cyclic_dependencies)}")
-                    print(f"  Valid: {plan.validation_report.is_valid}")
-                    
-                    # Domain distribution
-                    print(f"\n📂 Domain Organization:")
-                    for domain, count in sorted(plan.domain_distribution.items(), 
-                                               key=lambda x: x[1], reverse=True)[:10]:
-                        print(f"    {domain}: {count} files")
-                    
-                    # Generate reports
-                    report = orchestrator.generate_migration_report(plan)
-                    report_path = Path('/app/.migration/frontend_analysis_report.md')
-                    report_path.parent.mkdir(parents=True, exist_ok=True)
-                    report_path.write_text(report)
-                    print(f"\n📝 Frontend Report: {report_path}")
-                    
-                    # Generate review UI for low confidence
-                    if plan.review_required:
-                        ui_path = await orchestrator.generate_review_ui(plan)
-                        print(f"🔍 Review UI: {ui_path}")
-                    
-                    # Add results to extraction for comprehensive output
-                    for cls in plan.classifications:
-                        # Format frontend results to match expected structure
-                        frontend_result = {
-                            'file': cls.file_path,
-                            'service': Path(cls.file_path).stem,  # Add service name
-                            'platform': 'frontend',
-                            'domain': cls.primary_domain,
-                            'file_type': 'component',  # Default to component for frontend
-                            'confidence': cls.confidence,
-                            'requires_review': cls.requires_review,
-                            'dependencies': list(cls.dependencies),
-                            'classes': [],  # Frontend doesn't have Python classes
-                            'functions': [],  # Will be populated with React components
-                            'target': cls.base_classification.get('target', f'unified_{cls.primary_domain}_components/')
-                        }
+                    with FrontendMigrationOrchestrator() as orchestrator:
+                        # Full analysis with AST parsing
+                        print("\n📊 Running TypeScript AST Analysis...")
+                        plan = await orchestrator.analyze_frontend(confidence_threshold=0.7)
                         
-                        # Add component information if available
-                        if hasattr(cls, 'components'):
-                            for comp in cls.components:
-                                frontend_result['functions'].append({
-                                    'name': comp.name,
-                                    'type': 'component',
-                                    'hooks': comp.hooks_used
-                                })
+                        print(f"\n✅ Frontend Analysis Complete:")
+                        print(f"  Files Analyzed: {plan.total_files}")
+                        print(f"  Classifications: {len(plan.classifications)}")
+                        print(f"  High Confidence: {plan.confidence_distribution.get('high', 0)}")
+                        print(f"  Review Required: {len(plan.review_required)}")
                         
-                        self.extraction_results['services'].append(frontend_result)
+                        # Validation
+                        print(f"\n🔍 Dependency Validation:")
+                        print(f"  Domain Violations: {len(plan.validation_report.domain_violations)}")
+                        print(f"  Circular Dependencies: {len(plan.validation_report.cyclic_dependencies)}")
+                        print(f"  Valid: {plan.validation_report.is_valid}")
                         
-                        # Also add to all_results for comprehensive output
-                        self.all_results.append({
-                            'file': cls.file_path,
-                            'success': True,
-                            'platform': 'frontend',
-                            'domain': cls.primary_domain,
-                            'extracted_data': [frontend_result],
-                            'console_logs': [f"Frontend: {Path(cls.file_path).name} -> {cls.primary_domain} (confidence: {cls.confidence:.2f})"]
-                        })
-                    
-                    return plan
+                        # Domain distribution
+                        print(f"\n📂 Domain Organization:")
+                        for domain, count in sorted(plan.domain_distribution.items(), 
+                                                   key=lambda x: x[1], reverse=True)[:10]:
+                            print(f"    {domain}: {count} files")
+                        
+                        # Generate reports
+                        report = orchestrator.generate_migration_report(plan)
+                        report_path = Path('/app/.migration/frontend_analysis_report.md')
+                        report_path.parent.mkdir(parents=True, exist_ok=True)
+                        report_path.write_text(report)
+                        print(f"\n📝 Frontend Report: {report_path}")
+                        
+                        # Generate review UI for low confidence
+                        if plan.review_required:
+                            ui_path = await orchestrator.generate_review_ui(plan)
+                            print(f"🔍 Review UI: {ui_path}")
+                        
+                        # Add results to extraction for comprehensive output
+                        for cls in plan.classifications:
+                            # Format frontend results to match expected structure
+                            frontend_result = {
+                                'file': cls.file_path,
+                                'service': Path(cls.file_path).stem,  # Add service name
+                                'platform': 'frontend',
+                                'domain': cls.primary_domain,
+                                'file_type': 'component',  # Default to component for frontend
+                                'confidence': cls.confidence,
+                                'requires_review': cls.requires_review,
+                                'dependencies': list(cls.dependencies),
+                                'classes': [],  # Frontend doesn't have Python classes
+                                'functions': [],  # Will be populated with React components
+                                'target': cls.base_classification.get('target', f'unified_{cls.primary_domain}_components/')
+                            }
+                            
+                            # Add component information if available
+                            if hasattr(cls, 'components'):
+                                for comp in cls.components:
+                                    frontend_result['functions'].append({
+                                        'name': comp.name,
+                                        'type': 'component',
+                                        'hooks': comp.hooks_used
+                                    })
+                            
+                            self.extraction_results['services'].append(frontend_result)
+                            
+                            # Also add to all_results for comprehensive output
+                            self.all_results.append({
+                                'file': cls.file_path,
+                                'success': True,
+                                'platform': 'frontend',
+                                'domain': cls.primary_domain,
+                                'extracted_data': [frontend_result],
+                                'console_logs': [f"Frontend: {Path(cls.file_path).name} -> {cls.primary_domain} (confidence: {cls.confidence:.2f})"]
+                            })
+                        
+                        return plan
                 
                 # Run the enhanced frontend suite
                 frontend_plan = asyncio.run(run_frontend_suite())
@@ -6,11 +6,7 @@ Common utilities and helper functions used throughout ARK-TOOLS.
 """
 
 from .debug_logger import debug_log
-from .file_utils import FileUtils
-from .validation import ValidationUtils
 
 __all__ = [
-    'debug_log',
-    'FileUtils',
-    'ValidationUtils'
+    'debug_log'
 ]
\ No newline at end of file
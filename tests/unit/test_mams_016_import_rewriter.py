@@ -0,0 +1,73 @@
+"""
+Unit tests for the MAMS-016 import rewriter
+===========================================
+
+Tests the Hyperscan scan path of the moved-file import check with a stub scanner.
+"""
+
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip('arkyvus.utils.debug_logger')
+
+from ark_tools.mams_core import mams_016_import_rewriter
+from ark_tools.mams_core.mams_016_import_rewriter import ImportRewriter, FileMove
+
+
+class ScanTerminated(Exception):
+    """Stands in for hyperscan.ScanTerminated"""
+
+
+class StubScanner:
+    """Reports the given pattern ids and aborts like Hyperscan when the handler returns True"""
+
+    def __init__(self, pattern_ids):
+        self.pattern_ids = pattern_ids
+
+    def scan(self, data, match_event_handler, context):
+        for pattern_id in self.pattern_ids:
+            if match_event_handler(pattern_id, 0, 0, 0, context):
+                raise ScanTerminated()
+
+
+class TestImportScan:
+    """Tests for the moved-file import check"""
+
+    @pytest.fixture
+    def rewriter(self, monkeypatch):
+        """Rewriter with the stub Hyperscan module installed"""
+        monkeypatch.setattr(mams_016_import_rewriter, 'hyperscan',
+                            SimpleNamespace(ScanTerminated=ScanTerminated), raising=False)
+        monkeypatch.setattr(ImportRewriter, '_load_tsconfig_paths', lambda self: None)
+        return ImportRewriter()
+
+    @pytest.fixture
+    def source_file(self, tmp_path):
+        """A component importing a moved file"""
+        path = tmp_path / 'Login.tsx'
+        path.write_text("import { Button } from '@/components/ui/Button';\n")
+        return path
+
+    @pytest.fixture
+    def file_moves(self):
+        """A single moved component"""
+        return [FileMove(
+            from_path='client/src/components/ui/Button.tsx',
+            to_path='client/src/domains/ui/components/Button.tsx',
+            from_domain='shared',
+            to_domain='ui'
+        )]
+
+    @pytest.mark.asyncio
+    async def test_terminated_scan_reports_import(self, rewriter, source_file, file_moves):
+        """A scan stopped on the first hit counts as importing a moved file"""
+        assert await rewriter._file_imports_moved_files(
+            source_file, file_moves, scanner=StubScanner([0])
+        ) is True
+
+    @pytest.mark.asyncio
+    async def test_scan_without_match_reports_no_import(self, rewriter, source_file, file_moves):
+        """A scan that completes without a hit does not flag the file"""
+        assert await rewriter._file_imports_moved_files(
+            source_file, file_moves, scanner=StubScanner([])
+        ) is False
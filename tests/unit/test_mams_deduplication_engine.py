@@ -0,0 +1,185 @@
+"""
+Unit tests for the MAMS deduplication engine
+============================================
+
+Tests identical-run detection against a mocked connection pool.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, AsyncMock
+import pytest
+
+pytest.importorskip('asyncpg')
+
+from ark_tools.mams_core.mams_deduplication_engine import (
+    DeduplicationResult,
+    MAMSDeduplicationEngine,
+    INSERT_CATALOG_ITEM_SQL,
+    LOOKUP_INDEX_SQL,
+    PREVIOUS_RUN_SQL,
+    UPDATE_CATALOG_ITEM_SQL,
+    ensure_lookup_indexes,
+)
+
+
+class TestDeduplicationEngine:
+    """Tests for identical-run detection"""
+    
+    @pytest.fixture
+    def discovered_items(self):
+        """A single discovered service method"""
+        return [
+            {
+                'full_qualified_name': 'test.service.TestService',
+                'source_type': 'service',
+                'service_name': 'TestService',
+                'method_name': 'test_method',
+                'method_signature': {'method_name': 'test_method', 'parameters': []},
+                'current_state': 'discovered'
+            }
+        ]
+    
+    @pytest.fixture
+    def conn(self):
+        """Mock connection with no previous run and nothing catalogued"""
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value=None)
+        conn.fetch = AsyncMock(return_value=[{'id': None}])
+        return conn
+    
+    @pytest.fixture
+    def engine(self, conn):
+        """Engine bound to a mock pool handing out the mock connection"""
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+        
+        pool = MagicMock()
+        pool.acquire = acquire
+        return MAMSDeduplicationEngine(pool=pool)
+    
+    @pytest.mark.asyncio
+    async def test_identical_run_is_skipped(self, engine, conn, discovered_items):
+        """A completed run with the same fingerprint short-circuits the analysis"""
+        conn.fetchrow.return_value = {'id': 42, 'start_time': '2024-01-01 00:00:00'}
+        
+        analysis = await engine.analyze_discovery_run('MAMS-002', discovered_items, 'backend')
+        
+        assert analysis['action'] == 'skip_identical'
+        assert analysis['previous_execution_id'] == 42
+        assert analysis['items_analyzed'] == 1
+        assert analysis['deduplication_actions'] == []
+        conn.fetchrow.assert_awaited_once_with(
+            PREVIOUS_RUN_SQL, 'MAMS-002', engine._generate_run_fingerprint(discovered_items)
+        )
+    
+    @pytest.mark.asyncio
+    async def test_new_run_is_processed(self, engine, discovered_items):
+        """Without a previous run every new item is created"""
+        analysis = await engine.analyze_discovery_run('MAMS-002', discovered_items, 'backend')
+        
+        assert analysis['action'] == 'process'
+        assert analysis['statistics']['create'] == 1
+        assert analysis['deduplication_actions'][0]['result'].action == 'create'
+    
+    @pytest.mark.asyncio
+    async def test_run_completed_elsewhere_is_detected(self, engine, conn, discovered_items):
+        """A run completed by another process after the first analysis is still skipped"""
+        first = await engine.analyze_discovery_run('MAMS-002', discovered_items, 'backend')
+        conn.fetchrow.return_value = {'id': 7, 'start_time': '2024-01-01 00:00:00'}
+        second = await engine.analyze_discovery_run('MAMS-002', discovered_items, 'backend')
+        
+        assert first['action'] == 'process'
+        assert second['action'] == 'skip_identical'
+        assert conn.fetchrow.await_count == 2
+    
+    def test_structured_return_types_are_compared(self, engine):
+        """Dict and list return types are hashable for the memoized similarity"""
+        sig = {'method_name': 'get', 'parameters': ['id'], 'return_type': {'type': 'object'}}
+        changed = {**sig, 'return_type': ['object', 'null']}
+        
+        assert engine._calculate_signature_similarity(sig, dict(sig)) == 1.0
+        assert engine._calculate_signature_similarity(sig, changed) == pytest.approx(1 - 0.5 / 3)
+
+
+class TestDeduplicationActions:
+    """Tests for storing creates and updates"""
+    
+    @pytest.fixture
+    def conn(self):
+        """Mock connection whose transactions are no-op context managers"""
+        @asynccontextmanager
+        async def transaction():
+            yield
+        
+        conn = MagicMock()
+        conn.transaction = transaction
+        conn.execute = AsyncMock()
+        conn.executemany = AsyncMock()
+        return conn
+    
+    @pytest.fixture
+    def analysis(self):
+        """Two new items and one stale item"""
+        return {'deduplication_actions': [
+            {'item': {'full_qualified_name': 'svc.A.good', 'method_signature': {}},
+             'result': DeduplicationResult(action='create', reason='new')},
+            {'item': {'full_qualified_name': 'svc.A.bad', 'method_signature': {}},
+             'result': DeduplicationResult(action='create', reason='new')},
+            {'item': {'full_qualified_name': 'svc.B.old'},
+             'result': DeduplicationResult(action='update', reason='stale', existing_id='17')},
+        ]}
+    
+    @pytest.mark.asyncio
+    async def test_batch_binds_plain_parameters(self, conn, analysis):
+        """jsonb values are JSON text and numeric ids are ints, so any connection works"""
+        results = await MAMSDeduplicationEngine().execute_deduplication_actions(conn, analysis, 'exec-1')
+        
+        assert results['created'] == 2
+        assert results['updated'] == 1
+        assert results['errors'] == []
+        sql, creates = conn.executemany.await_args_list[0].args
+        assert sql == INSERT_CATALOG_ITEM_SQL
+        assert all(isinstance(row[4], str) and isinstance(row[6], str) for row in creates)
+        assert conn.executemany.await_args_list[1].args == (UPDATE_CATALOG_ITEM_SQL, [(17,)])
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_rows(self, conn, analysis):
+        """One bad row is reported by name and the other rows are still stored"""
+        conn.executemany.side_effect = Exception('batch failed')
+        
+        async def execute(sql, *args):
+            if args[1:2] == ('svc.A.bad',):
+                raise Exception('constraint violation')
+        conn.execute.side_effect = execute
+        
+        results = await MAMSDeduplicationEngine().execute_deduplication_actions(conn, analysis, 'exec-1')
+        
+        assert results['created'] == 1
+        assert results['updated'] == 1
+        assert results['errors'] == ['Error processing svc.A.bad: constraint violation']
+        assert conn.execute.await_count == 3
+
+
+class TestLookupIndexes:
+    """Tests for the one-time index creation"""
+    
+    @pytest.mark.asyncio
+    async def test_missing_and_invalid_indexes_are_built(self):
+        """Valid indexes are left alone; invalid ones are dropped before the rebuild"""
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(side_effect=[True, False])
+        conn.execute = AsyncMock()
+        
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+        
+        pool = MagicMock()
+        pool.acquire = acquire
+        await ensure_lookup_indexes(pool)
+        
+        assert [call.args[0] for call in conn.execute.await_args_list] == [
+            'DROP INDEX CONCURRENTLY IF EXISTS idx_msc_fqn',
+            LOOKUP_INDEX_SQL['idx_msc_fqn']
+        ]